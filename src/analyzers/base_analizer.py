@@ -2,23 +2,92 @@
 
 import os
 import logging
-from typing import Dict, List, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, List, Any, Iterator, Optional, Tuple
 from src.utils import CustomChatOpenAI
+from src.utils.file_utils import DEFAULT_EXCLUDE_DIRS, decode_text
 
 
 class BaseAnalyzer:
     """Base class for repository analyzers with common functionality."""
 
     # Common project files to always include regardless of extension
-    KEY_PROJECT_FILES = {
-        "README.md",
-        "Dockerfile",
-        "docker-compose.yml",
-    }
+    KEY_PROJECT_FILES = frozenset(
+        {
+            "README.md",
+            "Dockerfile",
+            "docker-compose.yml",
+        }
+    )
 
     # Maximum file size to analyze
     MAX_FILE_SIZE = 1024 * 100  # 100KB
 
+    # Read-only mapping of file extension to language name, defined by subclasses
+    EXTENSION_LANGUAGES = MappingProxyType({})
+
+    # Leading bytes checked for NUL bytes to detect binary files
+    BINARY_PROBE_SIZE = 512
+
+    # Threads used to read candidate files; reads are I/O bound
+    MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+    # Directory names that are never descended into while walking the repository
+    IGNORE_DIRS = DEFAULT_EXCLUDE_DIRS
+
+    # Suffixes of configuration files
+    CONFIG_EXTENSIONS = frozenset(
+        {
+            ".yml",
+            ".yaml",
+            ".properties",
+            ".xml",
+            ".toml",
+            ".json",
+            ".conf",
+            ".ini",
+            ".config",
+        }
+    )
+
+    # Suffixes of example/template configuration files (e.g. application.yml.example)
+    EXAMPLE_CONFIG_EXTENSIONS = frozenset({".example", ".template", ".sample"})
+
+    # Path fragments marking example configuration files, and the keywords that
+    # must also appear for such a file to count as configuration
+    EXAMPLE_CONFIG_MARKERS = (".example", ".template")
+    EXAMPLE_CONFIG_KEYWORDS = ("application", "config", "properties", "yml", "yaml")
+
+    # Example configuration files that are always treated as config files
+    SPECIAL_CONFIG_PATTERNS = (
+        "application-env-local.yml.example",
+        "application.yml.example",
+        "application-dev.yml.example",
+    )
+
+    # Path fragments identifying Sonar configuration files
+    SONAR_PATTERNS = (
+        "sonar-project.properties",
+        "sonarqube",
+        "sonar-scanner",
+        ".sonarcloud",
+        ".sonarqube",
+        ".sonar",
+    )
+
+    # Keywords in a path that indicate a configuration file
+    CONFIG_KEYWORDS = (
+        "config",
+        "settings",
+        "application",
+        "env",
+        "environment",
+        "properties",
+    )
+
     def __init__(self, config) -> None:
         """Initialize the base repository analyzer.
 
@@ -26,11 +95,43 @@ class BaseAnalyzer:
             config: Generator configuration
         """
         self.config = config
-        self.llm = CustomChatOpenAI(model=config.model, temperature=0)
+        # Assigning repo_info also resets the cached formatted analysis
         self.repo_info = {}
         self.analyzed = False
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    @property
+    def repo_info(self) -> Dict[str, Any]:
+        """Repository information gathered by the last analysis.
+
+        Returns:
+            Repository information dictionary
+        """
+        return self._repo_info
+
+    @repo_info.setter
+    def repo_info(self, value: Dict[str, Any]) -> None:
+        """Replace the repository information.
+
+        The formatted analysis is built from repo_info, so the cached copy is
+        discarded whenever repo_info is replaced.
+
+        Args:
+            value: New repository information dictionary
+        """
+        self._repo_info = value
+        # Formatted analysis for the current repo_info, built on first request
+        self._formatted_info = None
+
+    @cached_property
+    def llm(self) -> CustomChatOpenAI:
+        """LLM client, created on first use.
+
+        Returns:
+            Chat model configured for this analyzer
+        """
+        return CustomChatOpenAI(model=self.config.model, temperature=0)
+
     def _get_analyzable_extensions(self) -> set:
         """Get file extensions that should be analyzed.
 
@@ -51,18 +152,16 @@ class BaseAnalyzer:
         """
         return set()
 
-    def _detect_language(self, file_path: str) -> str:
-        """Detect the programming language based on file extension.
-
-        Should be overridden by subclasses.
+    def _language_for_extension(self, ext: str) -> str:
+        """Look up the language for an already lowercased file extension.
 
         Args:
-            file_path: Path to the file
+            ext: File extension including the leading dot, e.g. ".java"
 
         Returns:
             String representing the detected language
         """
-        return "Unknown"
+        return self.EXTENSION_LANGUAGES.get(ext, "Unknown")
 
     def _is_entry_point(self, content: str, language: str, file_path: str) -> bool:
         """Determine if a file is an entry point based on content and language.
@@ -106,6 +205,116 @@ class BaseAnalyzer:
 
         return score
 
+    def _iter_files(self, root: str) -> Iterator[Tuple[os.DirEntry, str]]:
+        """Iterate over all files in a directory tree, skipping ignored directories.
+
+        Args:
+            root: Root directory to walk
+
+        Yields:
+            Tuples of (directory entry, path relative to root)
+        """
+        prefix_len = len(root) + 1
+        stack = [root]
+
+        while stack:
+            directory = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.IGNORE_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.is_file():
+                            yield entry, entry.path[prefix_len:]
+            except OSError as e:
+                self.logger.warning(f"Error scanning {directory}: {str(e)}")
+
+            # Push in reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+
+    def _read_text_file(self, path: str) -> Optional[str]:
+        """Read a file as UTF-8 text, skipping binary files.
+
+        The first BINARY_PROBE_SIZE bytes are checked for NUL bytes before the
+        rest of the file is read, so binary files are never fully decoded.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            File content, or None if the file looks binary
+        """
+        with open(path, "rb") as f:
+            head = f.read(self.BINARY_PROBE_SIZE)
+            if b"\x00" in head:
+                return None
+            data = head + f.read()
+
+        return decode_text(data)
+
+    def _read_file_info(
+        self, candidate: Tuple[os.DirEntry, str, str, bool, bool, bool]
+    ) -> Optional[Dict[str, Any]]:
+        """Read a candidate file and build its file information.
+
+        Runs on worker threads, so it must not touch shared state.
+
+        Args:
+            candidate: Tuple of (directory entry, relative path, lowercased
+                extension, is shell script, is example config, is key file)
+
+        Returns:
+            File information dictionary, or None if the file was skipped
+        """
+        entry, rel_path, ext, is_shell_script, is_example_config, is_key_file = (
+            candidate
+        )
+        # Only the stat and the read can fail; everything after works on memory
+        try:
+            # The size comes from the stat result cached on the DirEntry
+            file_size = entry.stat().st_size
+            if file_size > self.MAX_FILE_SIZE:
+                return None
+            content = self._read_text_file(entry.path)
+        except OSError as e:
+            self.logger.warning(f"Error processing {rel_path}: {str(e)}")
+            return None
+
+        if content is None:
+            self.logger.debug(f"Skipping binary file: {rel_path}")
+            return None
+
+        language = self._language_for_extension(ext)
+
+        if is_key_file:
+            # Key project files usually aren't entry points
+            is_entry = False
+            is_config = self._is_config_file(rel_path)
+        else:
+            is_entry = self._is_entry_point(content, language, rel_path)
+
+            # For shell scripts, always consider them as config files
+            is_config = is_shell_script or self._is_config_file(rel_path)
+
+            # Special handling for example config files
+            if is_example_config and not is_config:
+                is_config = True
+                self.logger.info(
+                    f"Forced config detection for example file: {rel_path}"
+                )
+
+        return {
+            "path": rel_path,
+            "language": language,
+            "is_entry_point": is_entry,
+            "is_config": is_config,
+            "size": file_size,
+            "is_key_file": is_key_file,
+            "content": content,  # Store content for code analysis
+        }
+
     def _gather_file_info(self) -> Dict[str, Any]:
         """Gather information about files in the repository.
 
@@ -115,6 +324,8 @@ class BaseAnalyzer:
         files_info = []
         entry_points = []
         config_files = []
+        # Paths in config_files, for constant-time membership checks
+        config_paths = set()
         shell_scripts = []
         root_shell_scripts = []
         # Get analyzable extensions and key files from concrete implementation
@@ -124,181 +335,100 @@ class BaseAnalyzer:
         )
 
         # Track file stats for language detection
-        language_stats = {}
+        language_stats = Counter()
+        # Paths of key project files, collected as they are found
+        key_file_paths = []
         has_spring_boot = False
 
-        # First pass to identify key project files regardless of extension
-        for file_name in key_project_files:
+        # Enumerate candidates in a single walk; key files are picked up on the way
+        candidates = []
+        for entry, rel_path in self._iter_files(str(self.config.target_repo)):
             # Skip .gitlab-ci.yml file and Sonar-related files
-            if file_name == ".gitlab-ci.yml" or self._is_sonar_file(file_name):
+            if rel_path == ".gitlab-ci.yml" or self._is_sonar_file(rel_path):
                 continue
 
-            file_path = self.config.target_repo / file_name
-            if file_path.exists() and file_path.is_file():
-                try:
-                    rel_path = os.path.relpath(file_path, self.config.target_repo)
-                    file_stat = os.stat(file_path)
-                    if file_stat.st_size <= self.MAX_FILE_SIZE:
-                        with open(
-                            file_path, "r", encoding="utf-8", errors="ignore"
-                        ) as f:
-                            content = f.read()
-
-                        language = self._detect_language(rel_path)
-                        is_config = self._is_config_file(rel_path)
-
-                        # Check for Spring Boot Application
-                        if language == "Java" and "@SpringBootApplication" in content:
-                            has_spring_boot = True
-
-                        # Track language stats
-                        language_stats[language] = language_stats.get(language, 0) + 1
-
-                        file_info = {
-                            "path": rel_path,
-                            "language": language,
-                            "is_entry_point": False,  # Key project files usually aren't entry points
-                            "is_config": is_config,
-                            "size": file_stat.st_size,
-                            "is_key_file": True,
-                            "content": content,
-                        }
-
-                        files_info.append(file_info)
-
-                        if is_config:
-                            config_files.append(rel_path)
-                            self.logger.debug(f"Added key config file: {rel_path}")
-
-                        if rel_path.endswith(".sh"):
-                            shell_scripts.append(rel_path)
-                            # Ensure shell scripts are added to config_files
-                            if rel_path not in config_files:
-                                config_files.append(rel_path)
-                                self.logger.debug(
-                                    f"Added shell script to config files: {rel_path}"
-                                )
+            # Key project files only count in the repository root
+            is_key_file = os.sep not in rel_path and entry.name in key_project_files
 
-                except Exception as e:
-                    self.logger.warning(
-                        f"Error processing key file {file_path}: {str(e)}"
-                    )
+            # Classify by suffix with a single set lookup
+            ext = os.path.splitext(entry.name)[1].lower()
+            rel_path_lower = rel_path.lower()
 
-        # Second pass for regular file discovery
-        for root, _, files in os.walk(self.config.target_repo):
-            # Skip common directories to ignore
-            if any(
-                part in root
-                for part in [
-                    ".git",
-                    "node_modules",
-                    "venv",
-                    "__pycache__",
-                    "target",
-                    "build",
-                    "dist",
-                    ".gradle",
-                    "lemma",  # TODO - Temporarily ignore 'lemma' directory - will be needed in future
-                ]
-            ):
-                continue
+            # Include all shell scripts regardless of other criteria
+            is_shell_script = ext == ".sh"
 
-            for file in files:
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, self.config.target_repo)
+            # Explicitly check for example configuration files
+            is_example_config = any(
+                marker in rel_path_lower for marker in self.EXAMPLE_CONFIG_MARKERS
+            ) and any(conf in rel_path_lower for conf in self.EXAMPLE_CONFIG_KEYWORDS)
 
-                # Skip .gitlab-ci.yml file and Sonar-related files
-                if rel_path == ".gitlab-ci.yml" or self._is_sonar_file(rel_path):
-                    continue
+            # Check if we should analyze this file; key files are included
+            # regardless of extension
+            should_analyze = (
+                is_key_file
+                or is_shell_script
+                or is_example_config
+                or ext in analyzable_extensions
+            )
 
-                # Skip if we already processed this file as a key file
-                if any(info["path"] == rel_path for info in files_info):
-                    continue
+            if should_analyze:
+                candidates.append(
+                    (
+                        entry,
+                        rel_path,
+                        ext,
+                        is_shell_script,
+                        is_example_config,
+                        is_key_file,
+                    )
+                )
 
-                # Include all shell scripts regardless of other criteria
-                is_shell_script = rel_path.endswith(".sh")
+        # Read and classify candidates concurrently; results keep walk order
+        with ThreadPoolExecutor(max_workers=self.MAX_READ_WORKERS) as executor:
+            results = list(executor.map(self._read_file_info, candidates))
 
-                # Explicitly check for example configuration files
-                is_example_config = any(
-                    ext in rel_path.lower() for ext in [".example", ".template"]
-                ) and any(
-                    conf in rel_path.lower()
-                    for conf in ["application", "config", "properties", "yml", "yaml"]
-                )
+        # Collect results in this thread so no shared state needs locking
+        for (_, rel_path, _, is_shell_script, _, _), file_info in zip(
+            candidates, results
+        ):
+            if file_info is None:
+                continue
 
-                # Check if we should analyze this file
-                should_analyze = (
-                    is_shell_script
-                    or is_example_config
-                    or any(rel_path.endswith(ext) for ext in analyzable_extensions)
-                )
+            language = file_info["language"]
 
-                if not should_analyze:
-                    continue
+            # Track language stats
+            language_stats[language] += 1
 
-                try:
-                    file_stat = os.stat(file_path)
-                    if file_stat.st_size > self.MAX_FILE_SIZE:
-                        continue
-
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-
-                    language = self._detect_language(rel_path)
-                    is_entry = self._is_entry_point(content, language, rel_path)
-
-                    # For shell scripts, always consider them as config files
-                    is_config = is_shell_script or self._is_config_file(rel_path)
-
-                    # Special handling for example config files
-                    if is_example_config and not is_config:
-                        is_config = True
-                        self.logger.info(
-                            f"Forced config detection for example file: {rel_path}"
-                        )
-
-                    # Track language stats
-                    language_stats[language] = language_stats.get(language, 0) + 1
-
-                    # Check for Spring Boot Application
-                    if language == "Java" and "@SpringBootApplication" in content:
-                        has_spring_boot = True
-
-                    file_info = {
-                        "path": rel_path,
-                        "language": language,
-                        "is_entry_point": is_entry,
-                        "is_config": is_config,
-                        "size": file_stat.st_size,
-                        "is_key_file": False,
-                        "content": content,  # Store content for code analysis
-                    }
+            # Check for Spring Boot Application
+            if language == "Java" and "@SpringBootApplication" in file_info["content"]:
+                has_spring_boot = True
 
-                    files_info.append(file_info)
+            files_info.append(file_info)
 
-                    if is_entry:
-                        entry_points.append(rel_path)
+            if file_info["is_key_file"]:
+                key_file_paths.append(rel_path)
 
-                    if is_config:
-                        config_files.append(rel_path)
-                        self.logger.debug(f"Added regular config file: {rel_path}")
+            if file_info["is_entry_point"]:
+                entry_points.append(rel_path)
 
-                    if is_shell_script:
-                        shell_scripts.append(rel_path)
-                        # Ensure shell scripts are added to config_files
-                        if rel_path not in config_files:
-                            config_files.append(rel_path)
-                            self.logger.debug(
-                                f"Added shell script to config files: {rel_path}"
-                            )
+            if file_info["is_config"]:
+                config_files.append(rel_path)
+                config_paths.add(rel_path)
+                self.logger.debug(f"Added regular config file: {rel_path}")
 
-                except Exception as e:
-                    self.logger.warning(f"Error processing {rel_path}: {str(e)}")
+            if is_shell_script:
+                shell_scripts.append(rel_path)
+                # Ensure shell scripts are added to config_files
+                if rel_path not in config_paths:
+                    config_files.append(rel_path)
+                    config_paths.add(rel_path)
+                    self.logger.debug(f"Added shell script to config files: {rel_path}")
 
         # Add a reconciliation step to ensure all shell scripts are included in config_files
         for script in shell_scripts + root_shell_scripts:
-            if script not in config_files:
+            if script not in config_paths:
                 config_files.append(script)
+                config_paths.add(script)
                 self.logger.debug(
                     f"Added missing shell script to config files: {script}"
                 )
@@ -316,19 +446,17 @@ class BaseAnalyzer:
         primary_language = "Java" if has_spring_boot else None
 
         # Add special configuration files to config_files if they're not already there
-        special_config_patterns = [
-            "application-env-local.yml.example",
-            "application.yml.example",
-            "application-dev.yml.example",
-        ]
-
         for file_info in files_info:
             file_path = file_info["path"]
             if (
-                any(pattern in file_path.lower() for pattern in special_config_patterns)
-                and file_path not in config_files
+                any(
+                    pattern in file_path.lower()
+                    for pattern in self.SPECIAL_CONFIG_PATTERNS
+                )
+                and file_path not in config_paths
             ):
                 config_files.append(file_path)
+                config_paths.add(file_path)
                 self.logger.info(f"Added special config file: {file_path}")
                 # Also mark it as a config file in the file_info
                 file_info["is_config"] = True
@@ -338,9 +466,7 @@ class BaseAnalyzer:
             "files": sorted_files,
             "entry_points": entry_points,
             "config_files": config_files,
-            "key_project_files": [
-                info["path"] for info in files_info if info.get("is_key_file", False)
-            ],
+            "key_project_files": key_file_paths,
             "language_stats": language_stats,
             "has_spring_boot": has_spring_boot,
             "force_primary_language": primary_language,
@@ -362,16 +488,7 @@ class BaseAnalyzer:
         file_path_lower = file_path.lower()
 
         # Check for common Sonar configuration files
-        sonar_patterns = [
-            "sonar-project.properties",
-            "sonarqube",
-            "sonar-scanner",
-            ".sonarcloud",
-            ".sonarqube",
-            ".sonar",
-        ]
-
-        return any(pattern in file_path_lower for pattern in sonar_patterns)
+        return any(pattern in file_path_lower for pattern in self.SONAR_PATTERNS)
 
     def _is_config_file(self, file_path: str) -> bool:
         """Determine if a file is a configuration file.
@@ -401,51 +518,19 @@ class BaseAnalyzer:
             self.logger.info(f"Detected example config file: {file_path}")
             return True
 
+        ext = os.path.splitext(file_path_lower)[1]
+
         # Check for common configuration file extensions
-        if any(
-            file_path_lower.endswith(ext)
-            for ext in [
-                ".yml",
-                ".yaml",
-                ".properties",
-                ".xml",
-                ".toml",
-                ".json",
-                ".conf",
-                ".ini",
-                ".config",
-            ]
-        ):
+        if ext in self.CONFIG_EXTENSIONS:
             return True
 
         # Check for example/template configuration files
-        if any(
-            file_path_lower.endswith(ext)
-            for ext in [
-                ".example",
-                ".template",
-                ".sample",
-                ".yml.example",
-                ".yaml.example",
-                ".properties.example",
-                ".yml.template",
-                ".yaml.template",
-                ".properties.template",
-            ]
-        ):
+        if ext in self.EXAMPLE_CONFIG_EXTENSIONS:
             self.logger.info(f"Detected example/template config file: {file_path}")
             return True
 
         # Check for configuration keywords in the path
-        config_keywords = [
-            "config",
-            "settings",
-            "application",
-            "env",
-            "environment",
-            "properties",
-        ]
-        if any(keyword in file_path_lower for keyword in config_keywords):
+        if any(keyword in file_path_lower for keyword in self.CONFIG_KEYWORDS):
             return True
 
         return False
@@ -468,15 +553,14 @@ class BaseAnalyzer:
 
         # Use pre-computed language stats if available
         if "language_stats" in file_data:
-            lang_count = file_data["language_stats"]
+            lang_count = Counter(file_data["language_stats"])
         else:
             # Otherwise compute from files list
-            lang_count = {}
-            for file in file_data["files"]:
-                if file["language"] != "Unknown":
-                    lang_count[file["language"]] = (
-                        lang_count.get(file["language"], 0) + 1
-                    )
+            lang_count = Counter(
+                file["language"]
+                for file in file_data["files"]
+                if file["language"] != "Unknown"
+            )
 
         self.logger.info(f"Language distribution: {lang_count}")
 
@@ -494,7 +578,22 @@ class BaseAnalyzer:
             return "Unknown"
 
         # Use the most frequent language
-        return max(lang_count.items(), key=lambda x: x[1])[0]
+        return lang_count.most_common(1)[0][0]
+
+    def _has_non_whitespace(self, path) -> bool:
+        """Check whether a file contains anything other than whitespace.
+
+        Reads line by line and stops at the first non-blank line, so large
+        files are not loaded into memory just to test for emptiness.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            Boolean indicating if the file has non-whitespace content
+        """
+        with open(path, "rb") as f:
+            return any(line.strip() for line in f)
 
     def analyze_repository(self, update: bool = True) -> Dict[str, Any]:
         """Analyze the repository structure and content.
@@ -505,28 +604,37 @@ class BaseAnalyzer:
         Returns:
             Repository information dictionary
         """
-        # Check if a non-empty README exists in the root directory
-        root_readme_paths = [
-            self.config.target_repo / "README.md",
-            self.config.target_repo / "Readme.md",
-            self.config.target_repo / "readme.md",
-        ]
-
-        for path in root_readme_paths:
-            if path.exists() and path.is_file():
-                try:
-                    content = path.read_text(encoding="utf-8", errors="ignore")
-                    if content.strip():  # If README is not empty
-                        self.repo_info = {
-                            "name": self.config.target_repo.name,
-                            "readme_exists": True,
-                            "readme_path": str(path),
-                        }
-                except Exception as e:
-                    self.logger.warning(f"Error reading README at {path}: {str(e)}")
+        # Check if a non-empty README exists in the root directory, matching the
+        # name case-insensitively from a single directory read
+        root_readmes = []
+        try:
+            with os.scandir(self.config.target_repo) as it:
+                root_readmes = [
+                    entry
+                    for entry in it
+                    if entry.name.lower() == "readme.md" and entry.is_file()
+                ]
+        except OSError as e:
+            self.logger.warning(f"Error scanning {self.config.target_repo}: {str(e)}")
+
+        for entry in root_readmes:
+            try:
+                # Empty files are rejected from the size without opening them
+                if entry.stat().st_size > 0 and self._has_non_whitespace(entry.path):
+                    # Keep any earlier analysis so update=False can still
+                    # format it; the setter drops the cached formatted copy
+                    self.repo_info = {
+                        **self.repo_info,
+                        "name": self.config.target_repo.name,
+                        "readme_exists": True,
+                        "readme_path": entry.path,
+                    }
+                    break
+            except OSError as e:
+                self.logger.warning(f"Error reading README at {entry.path}: {str(e)}")
 
         if self.analyzed and not update:
-            formatted_info = self._format_repo_info()
+            formatted_info = self._get_formatted_info()
             # Return only the formatted analysis and necessary repo info
             return {
                 "name": self.repo_info["name"],
@@ -539,40 +647,30 @@ class BaseAnalyzer:
         files_info = file_data["files"]
         shell_scripts = file_data.get("shell_scripts", [])
         config_files = file_data["config_files"]  # Get existing config files
+        # Paths in config_files, for constant-time membership checks
+        config_paths = set(config_files)
 
         # Explicitly reconcile shell scripts with config files
         for script in shell_scripts:
-            if script not in config_files:
+            if script not in config_paths:
                 config_files.append(script)
+                config_paths.add(script)
                 self.logger.debug(
                     f"Added missing shell script to config files: {script}"
                 )
 
         # Explicitly scan for example configuration files
         example_config_files = []
-        for root, _, files in os.walk(self.config.target_repo):
-            for file in files:
-                if any(
-                    pattern in file.lower() for pattern in [".example", ".template"]
-                ):
-                    if any(
-                        conf in file.lower()
-                        for conf in [
-                            "application",
-                            "config",
-                            "properties",
-                            "yml",
-                            "yaml",
-                        ]
-                    ):
-                        rel_path = os.path.relpath(
-                            os.path.join(root, file), self.config.target_repo
-                        )
-                        if rel_path not in config_files:
-                            config_files.append(rel_path)
-
-                        example_config_files.append(rel_path)
-                        self.logger.info(f"Added example config file: {rel_path}")
+        for entry, rel_path in self._iter_files(str(self.config.target_repo)):
+            file_name = entry.name.lower()
+            if any(pattern in file_name for pattern in self.EXAMPLE_CONFIG_MARKERS):
+                if any(conf in file_name for conf in self.EXAMPLE_CONFIG_KEYWORDS):
+                    if rel_path not in config_paths:
+                        config_files.append(rel_path)
+                        config_paths.add(rel_path)
+
+                    example_config_files.append(rel_path)
+                    self.logger.info(f"Added example config file: {rel_path}")
 
         # Extract language-specific information (to be implemented by subclasses)
         lang_specific_info = self._extract_language_specific_info(files_info)
@@ -596,7 +694,7 @@ class BaseAnalyzer:
                         f"Error reading README at {file_path}: {str(e)}"
                     )
 
-        # Build repository information
+        # Build repository information; this discards any stale formatted analysis
         self.repo_info = {
             "name": self.config.target_repo.name,
             "primary_language": self._determine_primary_language(file_data),
@@ -607,10 +705,7 @@ class BaseAnalyzer:
             "key_project_files": file_data.get("key_project_files", []),
             "readme_files": readme_files,
             "readme_contents": readme_contents,
-            "file_breakdown": {
-                lang: count
-                for lang, count in file_data.get("language_stats", {}).items()
-            },
+            "file_breakdown": Counter(file_data.get("language_stats", {})),
             "files": files_info[:50],  # Include top 50 files by importance,
             "has_spring_boot": file_data.get("has_spring_boot", False),
             "shell_scripts": shell_scripts,
@@ -628,9 +723,19 @@ class BaseAnalyzer:
         self._generate_analysis_text()
 
         # Return the full repo_info dictionary with formatted analysis
-        formatted_info = self._format_repo_info()
+        formatted_info = self._get_formatted_info()
         return {**self.repo_info, "formatted_analysis": formatted_info}
 
+    def _get_formatted_info(self) -> str:
+        """Get the formatted repository information, reusing it while unchanged.
+
+        Returns:
+            Formatted repository information
+        """
+        if self._formatted_info is None:
+            self._formatted_info = self._format_repo_info()
+        return self._formatted_info
+
     def _extract_language_specific_info(
         self, files_info: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -674,9 +779,7 @@ class BaseAnalyzer:
             "\n## File Breakdown",
         ]
 
-        for lang, count in sorted(
-            info["file_breakdown"].items(), key=lambda x: x[1], reverse=True
-        ):
+        for lang, count in info["file_breakdown"].most_common():
             result.append(f"- {lang}: {count} files")
 
         if info["entry_points"]:
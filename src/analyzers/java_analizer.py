@@ -3,6 +3,8 @@
 import os
 import re
 import yaml
+from xml.etree import ElementTree
+from types import MappingProxyType
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -12,6 +14,69 @@ from src.analyzers.base_analizer import BaseAnalyzer
 class JavaAnalyzer(BaseAnalyzer):
     """Analyzes Java/Gradle/Spring Boot repository structure and content."""
 
+    # Languages of the file types found in Java/Gradle projects
+    EXTENSION_LANGUAGES = MappingProxyType(
+        {
+            ".java": "Java",
+            ".gradle": "Gradle",
+            ".properties": "Properties",
+            ".yml": "YAML",
+            ".yaml": "YAML",
+            ".xml": "XML",
+            # Shell scripts are always gathered, whatever the analyzable extensions
+            ".sh": "Shell",
+        }
+    )
+
+    # Path fragments that indicate a custom tool is in use, as (indicator, tool)
+    # pairs. A file name match or suffix match is also a substring match, so a
+    # single substring test per indicator covers all three cases.
+    CUSTOM_TOOL_INDICATORS = (
+        ("Dockerfile", "docker"),
+        ("docker-compose.yml", "docker"),
+        ("application.properties", "spring-boot"),
+        ("application.yml", "spring-boot"),
+        ("lombok.config", "lombok"),
+    )
+
+    # Java main method signature
+    MAIN_METHOD_PATTERN = re.compile(
+        r"public\s+static\s+void\s+main\s*\(\s*String\s*\[\s*\]\s*\w+\s*\)"
+    )
+
+    # Gradle application or Spring Boot plugin, in either the legacy
+    # "apply plugin:" form or the plugins { id(...) } block
+    GRADLE_APPLICATION_PATTERN = re.compile(
+        r'apply\s+plugin\s*:\s*[\'"](?:application|org\.springframework\.boot)[\'"]'
+        r'|plugins\s*{\s*id\s*\([\'"](?:application|org\.springframework\.boot)[\'"]\)'
+    )
+
+    # Patterns used to rank Java and Gradle files by content
+    SPRING_ANNOTATION_PATTERN = re.compile(
+        r"@(Controller|RestController|Service|Repository|Component|Configuration|SpringBootApplication)"
+    )
+    MAIN_METHOD_START_PATTERN = re.compile(r"public\s+static\s+void\s+main")
+    REST_MAPPING_PATTERN = re.compile(
+        r"@(GetMapping|PostMapping|PutMapping|DeleteMapping|RequestMapping)"
+    )
+    GRADLE_TASK_PATTERN = re.compile(r"task\s+(\w+)")
+
+    # Plugin ids declared in a Gradle plugins { } block
+    GRADLE_PLUGIN_ID_PATTERN = re.compile(r'plugins\s*{[^}]*id\s*[\'"]([^\'"]+)[\'"]')
+
+    # Gradle dependencies { } blocks and the two declaration formats inside them:
+    # implementation 'group:name:version'
+    # implementation(group: 'org.example', name: 'lib', version: '1.0')
+    GRADLE_DEPENDENCIES_BLOCK_PATTERN = re.compile(
+        r"dependencies\s*{([^}]*)}", re.DOTALL
+    )
+    GRADLE_STRING_DEPENDENCY_PATTERN = re.compile(
+        r'(\w+)\s*[\(\'"]([^\'"]*):([^\'"]*):([^\'"]*)[\'"\)]'
+    )
+    GRADLE_MAP_DEPENDENCY_PATTERN = re.compile(
+        r'(\w+)\s*\(\s*group\s*:\s*[\'"]([^\'"]*)[\'"],\s*name\s*:\s*[\'"]([^\'"]*)[\'"],\s*version\s*:\s*[\'"]([^\'"]*)[\'"]'
+    )
+
     def _get_analyzable_extensions(self) -> set:
         """Get file extensions that should be analyzed for Java projects.
 
@@ -58,27 +123,6 @@ class JavaAnalyzer(BaseAnalyzer):
             "application-prod.properties",
         }
 
-    def _detect_language(self, file_path: str) -> str:
-        """Detect the programming language based on file extension for Java projects.
-
-        Args:
-            file_path: Path to the file
-
-        Returns:
-            String representing the detected language
-        """
-        ext_map = {
-            ".java": "Java",
-            ".gradle": "Gradle",
-            ".properties": "Properties",
-            ".yml": "YAML",
-            ".yaml": "YAML",
-            ".xml": "XML",
-        }
-
-        ext = Path(file_path).suffix.lower()
-        return ext_map.get(ext, "Unknown")
-
     def _is_entry_point(self, content: str, language: str, file_path: str) -> bool:
         """Determine if a file is an entry point for Java/Spring Boot projects.
 
@@ -93,28 +137,19 @@ class JavaAnalyzer(BaseAnalyzer):
         # Java specific patterns
         if language == "Java":
             # Spring Boot application
-            if re.search(r"@SpringBootApplication", content):
+            if "@SpringBootApplication" in content:
                 self.logger.debug(f"Found Spring Boot entry point: {file_path}")
                 return True
 
             # Main method
-            if re.search(
-                r"public\s+static\s+void\s+main\s*\(\s*String\s*\[\s*\]\s*\w+\s*\)",
-                content,
-            ):
+            if self.MAIN_METHOD_PATTERN.search(content):
                 self.logger.info(f"Found Java main method entry point: {file_path}")
                 return True
 
         # Gradle build files
         elif language == "Gradle" or "gradle" in file_path.lower():
             # Look for application plugin or Spring Boot plugin
-            if re.search(
-                r'apply\s+plugin\s*:\s*[\'"](?:application|org\.springframework\.boot)[\'"]',
-                content,
-            ) or re.search(
-                r'plugins\s*{\s*id\s*\([\'"](?:application|org\.springframework\.boot)[\'"]\)',
-                content,
-            ):
+            if self.GRADLE_APPLICATION_PATTERN.search(content):
                 self.logger.info(f"Found Gradle application configuration: {file_path}")
                 return True
 
@@ -136,7 +171,7 @@ class JavaAnalyzer(BaseAnalyzer):
         content = file_info.get("content", "")
 
         # Spring Boot application classes are crucial
-        if content and re.search(r"@SpringBootApplication", content):
+        if content and "@SpringBootApplication" in content:
             score += 110
 
         # Priority based on Java filename patterns
@@ -165,7 +200,7 @@ class JavaAnalyzer(BaseAnalyzer):
             score += 75
 
         # Spring config files
-        if path.endswith(".properties") or path.endswith(".yml"):
+        if path.endswith((".properties", ".yml")):
             if "application" in path:
                 score += 70
                 # Higher priority for environment-specific configs
@@ -189,35 +224,29 @@ class JavaAnalyzer(BaseAnalyzer):
             # For Java files
             if path.endswith(".java"):
                 # Spring annotations are important
-                spring_annotations = re.findall(
-                    r"@(Controller|RestController|Service|Repository|Component|Configuration|SpringBootApplication)",
-                    content,
-                )
+                spring_annotations = self.SPRING_ANNOTATION_PATTERN.findall(content)
                 score += len(spring_annotations) * 10
 
                 # Main method is important
-                if re.search(r"public\s+static\s+void\s+main", content):
+                if self.MAIN_METHOD_START_PATTERN.search(content):
                     score += 30
 
                 # REST endpoints are important
-                rest_endpoints = re.findall(
-                    r"@(GetMapping|PostMapping|PutMapping|DeleteMapping|RequestMapping)",
-                    content,
-                )
+                rest_endpoints = self.REST_MAPPING_PATTERN.findall(content)
                 score += len(rest_endpoints) * 8
 
             # For Gradle files
             elif path.endswith(".gradle"):
                 # Spring Boot plugin is important
-                if re.search(r"org\.springframework\.boot", content):
+                if "org.springframework.boot" in content:
                     score += 25
 
                 # Application plugin is important
-                if re.search(r"application|java", content):
+                if "application" in content or "java" in content:
                     score += 20
 
                 # Custom tasks are important
-                custom_tasks = re.findall(r"task\s+(\w+)", content)
+                custom_tasks = self.GRADLE_TASK_PATTERN.findall(content)
                 score += len(custom_tasks) * 5
 
         return score
@@ -235,11 +264,7 @@ class JavaAnalyzer(BaseAnalyzer):
         file_distribution = "\n".join(
             [
                 f"- {lang}: {count} files"
-                for lang, count in sorted(
-                    info["file_breakdown"].items(),
-                    key=lambda x: x[1],
-                    reverse=True,
-                )
+                for lang, count in info["file_breakdown"].most_common()
             ]
         )
 
@@ -252,7 +277,7 @@ class JavaAnalyzer(BaseAnalyzer):
         example_configs = [
             kf
             for kf in info["key_project_files"]
-            if any(ext in kf.lower() for ext in [".example", ".template"])
+            if any(ext in kf.lower() for ext in self.EXAMPLE_CONFIG_MARKERS)
         ]
 
         # Regular configuration files (non-examples)
@@ -261,15 +286,14 @@ class JavaAnalyzer(BaseAnalyzer):
             for kf in info["key_project_files"]
             if (
                 kf.endswith((".properties", ".yml", ".yaml"))
-                and not any(ext in kf.lower() for ext in [".example", ".template"])
+                and not any(ext in kf.lower() for ext in self.EXAMPLE_CONFIG_MARKERS)
             )
         ]
 
         # Other key files
+        categorized_configs = set(example_configs).union(regular_configs)
         other_key_files = [
-            kf
-            for kf in info["key_project_files"]
-            if kf not in example_configs and kf not in regular_configs
+            kf for kf in info["key_project_files"] if kf not in categorized_configs
         ]
 
         # Create key files texts by category
@@ -460,9 +484,7 @@ class JavaAnalyzer(BaseAnalyzer):
             "\n## File Breakdown",
         ]
 
-        for lang, count in sorted(
-            info["file_breakdown"].items(), key=lambda x: x[1], reverse=True
-        ):
+        for lang, count in info["file_breakdown"].most_common():
             result.append(f"- {lang}: {count} files")
 
         # Add a "Quick Start" section with entry points and key commands
@@ -578,63 +600,92 @@ class JavaAnalyzer(BaseAnalyzer):
         """
         dependencies = []
 
-        # Look for Gradle dependencies
         for file in files_info:
             if not file["is_config"]:
                 continue
 
-            try:
-                content = file.get("content", "")
-                if not content:
-                    file_path = os.path.join(self.config.target_repo, file["path"])
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-
-                if file["path"].endswith(".gradle"):
-                    # Extract dependencies section
-                    dep_sections = re.findall(
-                        r"dependencies\s*{([^}]*)}", content, re.DOTALL
-                    )
-
-                    for section in dep_sections:
-                        # Format: implementation 'group:name:version'
-                        std_deps = re.findall(
-                            r'(\w+)\s*[\(\'"]([^\'"]*):([^\'"]*):([^\'"]*)[\'"\)]',
-                            section,
-                        )
-                        for config, group, name, version in std_deps:
-                            dependencies.append(f"{config} '{group}:{name}:{version}'")
+            # Pick the parser from the file type before touching the content
+            if file["path"].endswith(".gradle"):
+                parse = self._parse_gradle_dependencies
+            elif file["path"].endswith("pom.xml"):
+                parse = self._parse_maven_dependencies
+            else:
+                continue
 
-                        # Format: implementation(group: 'org.example', name: 'lib', version: '1.0')
-                        map_deps = re.findall(
-                            r'(\w+)\s*\(\s*group\s*:\s*[\'"]([^\'"]*)[\'"],\s*name\s*:\s*[\'"]([^\'"]*)[\'"],\s*version\s*:\s*[\'"]([^\'"]*)[\'"]',
-                            section,
-                        )
-                        for config, group, name, version in map_deps:
-                            dependencies.append(
-                                f"{config}(group: '{group}', name: '{name}', version: '{version}')"
-                            )
+            # Content was already read by _gather_file_info
+            content = file.get("content", "")
+            if not content:
+                continue
 
-                elif file["path"].endswith("pom.xml"):
-                    # Extract Maven dependencies
-                    deps = re.findall(
-                        r"<dependency>.*?<groupId>(.*?)</groupId>.*?<artifactId>(.*?)</artifactId>.*?<version>(.*?)</version>.*?</dependency>",
-                        content,
-                        re.DOTALL,
-                    )
-
-                    for group_id, artifact_id, version in deps:
-                        dependencies.append(
-                            f"{group_id.strip()}:{artifact_id.strip()}:{version.strip()}"
-                        )
+            try:
+                dependencies.extend(parse(content))
 
-            except Exception as e:
+            except ElementTree.ParseError as e:
                 self.logger.warning(
                     f"Error extracting dependencies from {file['path']}: {str(e)}"
                 )
 
         return dependencies
 
+    def _parse_gradle_dependencies(self, content: str) -> List[str]:
+        """Parse dependency declarations from a Gradle build file.
+
+        Args:
+            content: Content of the .gradle file
+
+        Returns:
+            List of dependency strings
+        """
+        dependencies = []
+
+        # Extract dependencies section
+        dep_sections = self.GRADLE_DEPENDENCIES_BLOCK_PATTERN.findall(content)
+
+        for section in dep_sections:
+            # Format: implementation 'group:name:version'
+            std_deps = self.GRADLE_STRING_DEPENDENCY_PATTERN.findall(section)
+            for config, group, name, version in std_deps:
+                dependencies.append(f"{config} '{group}:{name}:{version}'")
+
+            # Format: implementation(group: 'org.example', name: 'lib', version: '1.0')
+            map_deps = self.GRADLE_MAP_DEPENDENCY_PATTERN.findall(section)
+            for config, group, name, version in map_deps:
+                dependencies.append(
+                    f"{config}(group: '{group}', name: '{name}', version: '{version}')"
+                )
+
+        return dependencies
+
+    def _parse_maven_dependencies(self, content: str) -> List[str]:
+        """Parse dependency coordinates from a Maven POM.
+
+        Args:
+            content: Content of the pom.xml file
+
+        Returns:
+            List of "groupId:artifactId:version" strings for dependencies
+            that declare all three
+        """
+        dependencies = []
+        root = ElementTree.fromstring(content)
+
+        for element in root.iter():
+            # Tags carry the POM namespace, e.g. "{http://maven.apache.org/POM/4.0.0}dependency"
+            if element.tag.rpartition("}")[2] != "dependency":
+                continue
+
+            coordinates = {
+                child.tag.rpartition("}")[2]: (child.text or "").strip()
+                for child in element
+            }
+            group_id = coordinates.get("groupId")
+            artifact_id = coordinates.get("artifactId")
+            version = coordinates.get("version")
+            if group_id and artifact_id and version:
+                dependencies.append(f"{group_id}:{artifact_id}:{version}")
+
+        return dependencies
+
     def _detect_build_system(self, files_info: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Detect the build system used in the repository focusing on Gradle.
 
@@ -682,11 +733,8 @@ class JavaAnalyzer(BaseAnalyzer):
                         build_system["commands"]["run"] = []
                     build_system["commands"]["run"].append(f"./{file_path}")
 
-        for file_info in files_info:
-            file_path = file_info["path"]
-
             # Check for Gradle files
-            if file_path.endswith(".gradle"):
+            elif file_path.endswith(".gradle"):
                 build_system["type"] = "gradle"
                 build_system["files"].append(file_path)
 
@@ -694,9 +742,7 @@ class JavaAnalyzer(BaseAnalyzer):
                 content = file_info.get("content", "")
                 if content:
                     # Extract plugins
-                    plugins = re.findall(
-                        r'plugins\s*{[^}]*id\s*[\'"]([^\'"]+)[\'"]', content
-                    )
+                    plugins = self.GRADLE_PLUGIN_ID_PATTERN.findall(content)
                     build_system["plugins"].extend(plugins)
 
         # Check for Gradle wrapper
@@ -733,27 +779,19 @@ class JavaAnalyzer(BaseAnalyzer):
             Dictionary with custom tools information
         """
         custom_tools = []
-
-        # Check for common custom tools and directories
-        custom_tool_indicators = {
-            "docker": ["Dockerfile", "docker-compose.yml"],
-            "spring-boot": ["application.properties", "application.yml"],
-            "lombok": ["lombok.config"],
-        }
+        all_tools = {tool for _, tool in self.CUSTOM_TOOL_INDICATORS}
 
         for file_info in files_info:
+            # Nothing left to find once every known tool has been detected
+            if len(custom_tools) == len(all_tools):
+                break
+
             file_path = file_info["path"]
-            file_name = os.path.basename(file_path)
             content = file_info.get("content", "")
 
-            for tool, indicators in custom_tool_indicators.items():
-                if (
-                    file_name in indicators
-                    or any(file_path.endswith(ext) for ext in indicators)
-                    or any(part in file_path for part in indicators)
-                ):
-                    if tool not in custom_tools:
-                        custom_tools.append(tool)
+            for indicator, tool in self.CUSTOM_TOOL_INDICATORS:
+                if indicator in file_path and tool not in custom_tools:
+                    custom_tools.append(tool)
 
             # Check for Spring Boot in Java files
             if (
@@ -797,9 +835,7 @@ class JavaAnalyzer(BaseAnalyzer):
             "\n## File Breakdown",
         ]
 
-        for lang, count in sorted(
-            info["file_breakdown"].items(), key=lambda x: x[1], reverse=True
-        ):
+        for lang, count in info["file_breakdown"].most_common():
             result.append(f"- {lang}: {count} files")
 
         if info["entry_points"]:
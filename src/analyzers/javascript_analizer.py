@@ -1,6 +1,6 @@
 """JavaScript repository analysis module (placeholder for future implementation)."""
 
-from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Set
 
 from src.analyzers.base_analizer import BaseAnalyzer
@@ -9,6 +9,23 @@ from src.analyzers.base_analizer import BaseAnalyzer
 class JavaScriptAnalyzer(BaseAnalyzer):
     """Analyzes JavaScript/TypeScript repository structure and content."""
 
+    # Languages of the file types found in JavaScript projects
+    EXTENSION_LANGUAGES = MappingProxyType(
+        {
+            ".js": "JavaScript",
+            ".jsx": "React",
+            ".ts": "TypeScript",
+            ".tsx": "React TypeScript",
+            ".json": "JSON",
+            ".html": "HTML",
+            ".css": "CSS",
+            ".scss": "SCSS",
+            ".vue": "Vue",
+            # Shell scripts are always gathered, whatever the analyzable extensions
+            ".sh": "Shell",
+        }
+    )
+
     def _get_analyzable_extensions(self) -> set:
         """Get file extensions that should be analyzed for JavaScript projects."""
         return {
@@ -40,23 +57,6 @@ class JavaScriptAnalyzer(BaseAnalyzer):
             "app.js",
         }
 
-    def _detect_language(self, file_path: str) -> str:
-        """Detect the programming language based on file extension for JavaScript projects."""
-        ext_map = {
-            ".js": "JavaScript",
-            ".jsx": "React",
-            ".ts": "TypeScript",
-            ".tsx": "React TypeScript",
-            ".json": "JSON",
-            ".html": "HTML",
-            ".css": "CSS",
-            ".scss": "SCSS",
-            ".vue": "Vue",
-        }
-
-        ext = Path(file_path).suffix.lower()
-        return ext_map.get(ext, "Unknown")
-
     def _is_entry_point(self, content: str, language: str, file_path: str) -> bool:
         """Determine if a file is an entry point for JavaScript projects."""
         # This is a placeholder implementation
@@ -148,9 +148,7 @@ class JavaScriptAnalyzer(BaseAnalyzer):
             "\n## File Breakdown",
         ]
 
-        for lang, count in sorted(
-            info["file_breakdown"].items(), key=lambda x: x[1], reverse=True
-        ):
+        for lang, count in info["file_breakdown"].most_common():
             result.append(f"- {lang}: {count} files")
 
         if info["entry_points"]:
@@ -1,6 +1,6 @@
 """Python repository analysis module (placeholder for future implementation)."""
 
-from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Set
 
 from src.analyzers.base_analizer import BaseAnalyzer
@@ -9,6 +9,20 @@ from src.analyzers.base_analizer import BaseAnalyzer
 class PythonAnalyzer(BaseAnalyzer):
     """Analyzes Python repository structure and content."""
 
+    # Languages of the file types found in Python projects
+    EXTENSION_LANGUAGES = MappingProxyType(
+        {
+            ".py": "Python",
+            ".toml": "TOML",
+            ".ini": "INI",
+            ".yml": "YAML",
+            ".yaml": "YAML",
+            ".json": "JSON",
+            # Shell scripts are always gathered, whatever the analyzable extensions
+            ".sh": "Shell",
+        }
+    )
+
     def _get_analyzable_extensions(self) -> set:
         """Get file extensions that should be analyzed for Python projects."""
         return {
@@ -36,20 +50,6 @@ class PythonAnalyzer(BaseAnalyzer):
             "wsgi.py",
         }
 
-    def _detect_language(self, file_path: str) -> str:
-        """Detect the programming language based on file extension for Python projects."""
-        ext_map = {
-            ".py": "Python",
-            ".toml": "TOML",
-            ".ini": "INI",
-            ".yml": "YAML",
-            ".yaml": "YAML",
-            ".json": "JSON",
-        }
-
-        ext = Path(file_path).suffix.lower()
-        return ext_map.get(ext, "Unknown")
-
     def _is_entry_point(self, content: str, language: str, file_path: str) -> bool:
         """Determine if a file is an entry point for Python projects."""
         # This is a placeholder implementation
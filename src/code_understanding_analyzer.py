@@ -62,7 +62,7 @@ class CodeUnderstandingAnalyzer:
         if path.endswith(".gradle") or "gradle" in path:
             score += 75
 
-        if path.endswith(".properties") or path.endswith(".yml"):
+        if path.endswith((".properties", ".yml")):
             if "application" in path:
                 score += 70
                 if "local" in path or "dev" in path:
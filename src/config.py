@@ -18,6 +18,8 @@ class GeneratorConfig:
     language: str = "auto"  # Language analyzer to use: auto, java, python, javascript
     log_level: str = "DEBUG"
     save_intermediates: bool = False  # Flag to control saving intermediate debug files
+    llm_concurrency: int = 4  # Maximum LLM requests in flight for independent steps
+    llm_cache: bool = False  # Reuse stored LLM responses for identical prompts
 
     def __post_init__(self) -> None:
         """Initialize derived configuration values."""
@@ -31,6 +33,8 @@ class GeneratorConfig:
 
         self.intermediates_dir = self.output_dir / "intermediates"
 
+        self.llm_cache_dir = self.output_dir / "llm_cache"
+
         self.output_dir.mkdir(exist_ok=True, parents=True)
         if self.save_intermediates:
             self.intermediates_dir.mkdir(exist_ok=True, parents=True)
@@ -65,6 +69,12 @@ class GeneratorConfig:
         if self.save_intermediates:
             self.intermediates_dir.mkdir(exist_ok=True, parents=True)
 
+        # At least one LLM request must be allowed in flight
+        if self.llm_concurrency < 1:
+            raise ValueError(
+                f"Invalid LLM concurrency: {self.llm_concurrency}. Must be at least 1."
+            )
+
         # Validate language choice
         if self.language not in ["auto", "java", "python", "javascript"]:
             raise ValueError(
@@ -75,6 +75,17 @@ def main():
         action="store_true",
         help="Save intermediate files and debug information to 'output/intermediates' directory",
     )
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent LLM requests for steps that do not depend on each other",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Reuse LLM responses cached in 'output/llm_cache' for identical prompts",
+    )
 
     args = parser.parse_args()
 
@@ -89,6 +100,8 @@ def main():
             language=args.language,
             log_level=args.log_level,
             save_intermediates=args.save_intermediates,
+            llm_concurrency=args.llm_concurrency,
+            llm_cache=args.llm_cache,
         )
 
         setup_logging(config)
@@ -1,19 +1,24 @@
 """Main README generator implementation with enhanced logging."""
 
+import asyncio
+import fnmatch
+import json
 import os
 import logging
 import re
+from functools import cached_property
 from pathlib import Path
-from typing import List
+from string import Template
+from typing import List, Optional
 
 from src.config import GeneratorConfig
 from src.analyzers.base_analizer import BaseAnalyzer
 
-from langchain.chains import LLMChain
-from langchain_core.prompts import PromptTemplate
-from langchain.memory import SimpleMemory
 from src.utils import CustomChatOpenAI
+from src.utils.file_utils import write_text_if_changed
 from src.utils.intermediate_file_manager import IntermediateFileManager
+from src.utils.llm_cache import LLMResponseCache
+from src.utils.readme_utils import extract_reasoning
 
 
 class ReadmeGenerator:
@@ -145,16 +150,6 @@ class ReadmeGenerator:
             Evaluation Summary:
             ${readme_evaluation}
 
-            ## Original README Content
-            ```markdown
-            ${original_readme}
-            ```
-
-            ## AI-Generated README Content (Step 3)
-            ```markdown
-            ${generated_readme}
-            ```
-
             ## Your Task
             Create an optimized final README based on the evaluation results.
 
@@ -200,6 +195,39 @@ class ReadmeGenerator:
             """,
     }
 
+    # Both READMEs, placed first in the README evaluation prompt and in the step 4
+    # prompt so the second request starts with the same prefix as the first and
+    # can be served from the provider's prompt cache
+    README_COMPARISON_PROMPT = """# README Comparison
+
+## Original README Content
+```markdown
+${original_readme}
+```
+
+## AI-Generated README Content (Step 3)
+```markdown
+${generated_readme}
+```
+"""
+
+    # Previous steps whose output each step's prompt is built from
+    STEP_DEPENDENCIES = {
+        1: (),
+        2: (),
+        3: (1, 2),
+        4: (3,),
+    }
+
+    # Two-digit step number prefix of a step prompt file name
+    STEP_NUMBER_PATTERN = re.compile(r"^(\d{2})-")
+
+    # Step output file name, capturing the step number
+    STEP_OUTPUT_PATTERN = re.compile(r"step_(\d+)_output\.md$")
+
+    # Runs of three or more newlines, collapsed to one blank line in prompts
+    BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
     STEP_NAMES = {
         1: "project-purpose",
         2: "usage-instructions",
@@ -217,8 +245,12 @@ class ReadmeGenerator:
 
             self.analyzer = get_analyzer_for_repo(config)
 
-        self.llm = CustomChatOpenAI(model=config.model, temperature=0)
         self._has_checked_skipped = False
+        # Step outputs by step number, kept in memory once written or read
+        self._step_outputs = {}
+        # Context shared by every step, and the repo_context it was built from
+        self._base_context = None
+        self._base_context_source = None
         self.logger = logging.getLogger("ReadmeGenerator")
 
         # Extract model identifier
@@ -226,6 +258,22 @@ class ReadmeGenerator:
 
         self.file_manager = IntermediateFileManager(config)
 
+        # Responses from earlier runs, reused for identical prompts when enabled
+        self.response_cache = (
+            LLMResponseCache(config.llm_cache_dir, config.model)
+            if config.llm_cache
+            else None
+        )
+
+    @cached_property
+    def llm(self) -> CustomChatOpenAI:
+        """LLM client, created on first use.
+
+        Returns:
+            Chat model configured for README generation
+        """
+        return CustomChatOpenAI(model=self.config.model, temperature=0)
+
     def _get_model_identifier(self) -> str:
         """Return the exact model string as provided in the config.
 
@@ -250,7 +298,7 @@ class ReadmeGenerator:
                 name = filename.stem
 
             # Look for a two-digit number at the start
-            match = re.match(r"^(\d{2})-", name)
+            match = self.STEP_NUMBER_PATTERN.match(name)
             if match:
                 return int(match.group(1))
             return 0
@@ -263,18 +311,22 @@ class ReadmeGenerator:
         Returns:
             List of valid step file paths
         """
-        # Get all potential step files (with numeric prefix)
-        step_files = [
-            f
-            for f in self.config.prompts_dir.glob("[0-9][0-9]-*.md")
-            if self.extract_step_number(f) > 0
-        ]
-
-        # Filter out .SKIP files
-        valid_files = [f for f in step_files if ".SKIP." not in f.name]
+        # Collect (step number, path) pairs from one listing, skipping .SKIP
+        # files, so each name is parsed once and the pairs sort by step number
+        numbered_files = []
+        try:
+            with os.scandir(self.config.prompts_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".md") or ".SKIP." in entry.name:
+                        continue
+                    step_num = self.extract_step_number(entry.name)
+                    if step_num > 0:
+                        numbered_files.append((step_num, entry.path))
+        except FileNotFoundError:
+            pass
 
-        # Sort by step number
-        valid_files.sort(key=lambda f: self.extract_step_number(f))
+        numbered_files.sort()
+        valid_files = [Path(path) for _, path in numbered_files]
 
         self.logger.info(f"Found {len(valid_files)} valid step files")
         return valid_files
@@ -299,9 +351,9 @@ class ReadmeGenerator:
         # Collect outputs from previous steps, skipping any that don't exist
         outputs = []
         for i in range(1, current_step):
-            output_file = self.get_output_path(i)
-            if output_file.exists() and output_file.stat().st_size > 0:
-                outputs.append(output_file.read_text())
+            output = self._read_step_output(i)
+            if output:
+                outputs.append(output)
                 self.logger.debug(f"Added context from step {i}")
 
         # Return combined outputs
@@ -309,13 +361,166 @@ class ReadmeGenerator:
         self.logger.debug(f"Prepared context with {len(outputs)} previous steps")
         return combined
 
-    def process_prompt(self, step_num: int) -> bool:
-        """Process a prompt for a specific step."""
+    def _read_step_output(self, step_num: int) -> str:
+        """Get the output of a completed step.
+
+        Outputs written in this run are served from memory; outputs left by an
+        earlier run are read from disk once and then kept.
+
+        Args:
+            step_num: Step number whose output to get
+
+        Returns:
+            The step output, or an empty string if the step has no output
+        """
+        if step_num not in self._step_outputs:
+            output_file = self.get_output_path(step_num)
+            try:
+                if os.path.getsize(output_file) == 0:
+                    return ""
+            except FileNotFoundError:
+                return ""
+            self._step_outputs[step_num] = output_file.read_text(encoding="utf-8")
+
+        return self._step_outputs[step_num]
+
+    def process_prompts(self, step_nums: List[int]) -> List[int]:
+        """Process prompts for several independent steps concurrently.
+
+        All prompts are built first; those without a cached response are then
+        sent in a single batch, limited to config.llm_concurrency requests in
+        flight. A step whose prompt cannot be built or whose request fails is
+        reported as failed without affecting the other steps.
+
+        Args:
+            step_nums: Step numbers whose prompts do not depend on each other
+
+        Returns:
+            List of step numbers that failed
+        """
+        failed_steps = []
+        prompts = {}
+        for step_num in step_nums:
+            try:
+                full_prompt = self._build_step_prompt(step_num)
+            except Exception as e:
+                self.logger.error(f"Error building prompt for step {step_num}: {e}")
+                full_prompt = None
+
+            if full_prompt is None:
+                failed_steps.append(step_num)
+            else:
+                prompts[step_num] = full_prompt
+
+        uncached_prompts = {}
+        for step_num, full_prompt in prompts.items():
+            cached_content = self._get_cached_response(full_prompt)
+            if cached_content is None:
+                uncached_prompts[step_num] = full_prompt
+            else:
+                self._write_step_output(step_num, cached_content)
+
+        if uncached_prompts:
+            # With return_exceptions, a failed request comes back as its
+            # exception, so the other responses are still written and cached
+            responses = self.llm.batch(
+                list(uncached_prompts.values()),
+                config={"max_concurrency": self.config.llm_concurrency},
+                return_exceptions=True,
+            )
+            for step_num, response in zip(uncached_prompts, responses):
+                if isinstance(response, Exception):
+                    self.logger.error(
+                        f"LLM request for step {step_num} failed: {response}"
+                    )
+                    failed_steps.append(step_num)
+                    continue
+                self._cache_response(uncached_prompts[step_num], response.content)
+                self._write_step_output(step_num, response.content)
+
+        return sorted(failed_steps)
+
+    def _get_cached_response(self, prompt: str) -> Optional[str]:
+        """Get a cached LLM response for a prompt.
+
+        Args:
+            prompt: Prompt to look up
+
+        Returns:
+            Cached response text, or None if caching is disabled or missed
+        """
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(prompt)
+
+    def _cache_response(self, prompt: str, response_content: str) -> None:
+        """Store an LLM response for a prompt if caching is enabled.
+
+        Args:
+            prompt: Prompt sent to the LLM
+            response_content: Response text returned by the LLM
+        """
+        if self.response_cache is not None:
+            self.response_cache.set(prompt, response_content)
+
+    def _group_steps_into_waves(self, steps: List[int]) -> List[List[int]]:
+        """Group steps into waves that can be processed concurrently.
+
+        A step joins a wave once every dependency scheduled in this run has
+        been placed in an earlier wave. Dependencies outside this run (e.g.
+        steps completed before a resume) are already on disk.
+
+        Args:
+            steps: Step numbers to process, in order
+
+        Returns:
+            List of waves, each a list of step numbers
+
+        Raises:
+            ValueError: If STEP_DEPENDENCIES names an unknown step or contains
+                a cycle, so that no order satisfies it
+        """
+        for step_num in steps:
+            unknown = [
+                dep
+                for dep in self.STEP_DEPENDENCIES.get(step_num, ())
+                if dep not in self.STEP_PROMPTS
+            ]
+            if unknown:
+                raise ValueError(f"Step {step_num} depends on unknown steps: {unknown}")
+
+        waves = []
+        done = set()
+        pending = list(steps)
+        while pending:
+            wave = [
+                step_num
+                for step_num in pending
+                if all(
+                    dep in done or dep not in steps
+                    for dep in self.STEP_DEPENDENCIES.get(step_num, ())
+                )
+            ]
+            if not wave:
+                raise ValueError(f"Circular step dependencies among steps: {pending}")
+            waves.append(wave)
+            done.update(wave)
+            pending = [step_num for step_num in pending if step_num not in done]
+        return waves
+
+    def _build_step_prompt(self, step_num: int) -> Optional[str]:
+        """Build the full prompt for a step, saving intermediates as configured.
+
+        Args:
+            step_num: Step number to build the prompt for
+
+        Returns:
+            The prompt text, or None if the step cannot be processed
+        """
         if step_num not in self.STEP_PROMPTS:
             self.logger.error(f"Invalid step number: {step_num}")
-            return False
+            return None
 
-        output_file = self.get_output_path(step_num)
         step_name = self.STEP_NAMES.get(step_num, f"step-{step_num}")
 
         self.logger.info(f"Processing step {step_num}: {step_name}")
@@ -323,7 +528,7 @@ class ReadmeGenerator:
         # Check if we have repository context
         if not hasattr(self, "repo_context"):
             self.logger.error("Repository context missing. Run analysis first.")
-            return False
+            return None
 
         # Prepare enhanced context for this step using our improved method
         enhanced_context = self.prepare_enhanced_context(self.repo_context, step_num)
@@ -349,24 +554,30 @@ class ReadmeGenerator:
                 f"Prompt contains generated README: {'${generated_readme}' not in full_prompt}"
             )
 
-        # Call the LLM
-        response = self.llm.invoke(full_prompt)
+        return full_prompt
 
-        # Extract output content
-        output_content = response.content
+    def _write_step_output(self, step_num: int, output_content: str) -> None:
+        """Write the LLM output for a step to the output directory.
 
-        if step_num == 4:
-            from src.utils.readme_utils import extract_reasoning
+        Args:
+            step_num: Step number the output belongs to
+            output_content: Raw content returned by the LLM
+        """
+        output_file = self.get_output_path(step_num)
+        step_name = self.STEP_NAMES.get(step_num, f"step-{step_num}")
+        repo_name = self.repo_context.get("name", "unknown_repo")
 
+        if step_num == 4:
             # Extract reasoning
             output_content_cleaned, reasoning_text = extract_reasoning(output_content)
 
             # Write cleaned output to output file
-            output_file.write_text(output_content_cleaned)
+            write_text_if_changed(output_file, output_content_cleaned)
+            self._step_outputs[step_num] = output_content_cleaned
 
             # Write reasoning to separate file
             reasoning_file = self.config.output_dir / "reasoning.md"
-            reasoning_file.write_text(reasoning_text)
+            write_text_if_changed(reasoning_file, reasoning_text)
 
             self.logger.info(f"Extracted reasoning and saved to {reasoning_file}")
 
@@ -375,13 +586,13 @@ class ReadmeGenerator:
                 reasoning_filename = f"{repo_name}_step{step_num}_{step_name}_reasoning_{self.model_identifier}.md"
                 reasoning_path = self.config.intermediates_dir / reasoning_filename
 
-                with open(reasoning_path, "w", encoding="utf-8") as f:
-                    f.write(reasoning_text)
+                write_text_if_changed(reasoning_path, reasoning_text)
 
                 self.logger.info(f"Reasoning saved to: {reasoning_path}")
         else:
             # For other steps, just write the output as usual
-            output_file.write_text(output_content)
+            write_text_if_changed(output_file, output_content)
+            self._step_outputs[step_num] = output_content
 
         # Save a copy of the step output using the file manager
         self.file_manager.save_step_output(
@@ -393,7 +604,6 @@ class ReadmeGenerator:
         )
 
         self.logger.info(f"Successfully processed step {step_num}")
-        return True
 
     def _log_repository_details(self, repo_context):
         """Log detailed information about the analyzed repository.
@@ -512,10 +722,10 @@ class ReadmeGenerator:
 
             self.logger.info(f"Processing steps: {steps_to_process}")
 
-            # Process each step
+            # Process each wave of independent steps concurrently
             failed_steps = []
-            for step_num in steps_to_process:
-                if not self.process_prompt(step_num):
+            for wave in self._group_steps_into_waves(steps_to_process):
+                for step_num in self.process_prompts(wave):
                     self.logger.warning(f"Failed to process step {step_num}")
                     failed_steps.append(step_num)
 
@@ -530,9 +740,17 @@ class ReadmeGenerator:
             final_step = max(self.STEP_PROMPTS.keys())
             final_output = self.get_output_path(final_step)
 
-            if final_output.exists():
+            # The final output is normally still in memory; otherwise open the
+            # file directly rather than checking for it first
+            readme_content = self._step_outputs.get(final_step)
+            if readme_content is None:
+                try:
+                    readme_content = final_output.read_text(encoding="utf-8")
+                except FileNotFoundError:
+                    pass
+
+            if readme_content is not None:
                 repo_name = self.repo_context.get("name", "unknown_repo")
-                readme_content = final_output.read_text(encoding="utf-8")
 
                 # Save final README using the file manager (this will save to README.md)
                 self.file_manager.save_final_readme(
@@ -550,7 +768,12 @@ class ReadmeGenerator:
     def cleanup_step_files(self) -> None:
         """Remove all intermediate step output files after final README generation."""
         try:
-            step_files = list(self.config.output_dir.glob("step_*_output.md"))
+            with os.scandir(self.config.output_dir) as it:
+                step_files = [
+                    entry.path
+                    for entry in it
+                    if fnmatch.fnmatch(entry.name, "step_*_output.md")
+                ]
             if not step_files:
                 self.logger.info("No step files to clean up")
                 return
@@ -558,7 +781,7 @@ class ReadmeGenerator:
             # Remove each file from the output directory only
             for file in step_files:
                 try:
-                    file.unlink()
+                    os.unlink(file)
                     self.logger.info(f"Removed intermediate file: {file}")
                 except Exception as e:
                     self.logger.warning(f"Failed to remove {file}: {e}")
@@ -582,9 +805,6 @@ class ReadmeGenerator:
         if not self.config.save_intermediates:
             return
 
-        import json
-        from datetime import datetime
-
         try:
             intermediates_dir = self.config.intermediates_dir
 
@@ -626,6 +846,39 @@ class ReadmeGenerator:
         Returns:
             Dictionary with structured context optimized for LLM prompt
         """
+        # The base context only depends on repo_context, so it is built once and
+        # shared by every step; the step builders work on copies of it
+        if self._base_context_source is not repo_context:
+            self._base_context = self._build_base_context(repo_context)
+            self._base_context_source = repo_context
+        base_context = self._base_context
+
+        # Step-specific context enrichment
+        if step_num == 1:  # Project Purpose
+            # For step 1, focus on key files and code structure
+            return self._build_step1_context(base_context, repo_context)
+        elif step_num == 2:  # Usage Instructions
+            # For step 2, focus on configuration and execution
+            return self._build_step2_context(base_context, repo_context)
+        elif step_num == 3:  # Final README
+            # For step 3, include all previous outputs and comprehensive information
+            return self._build_step3_context(base_context, repo_context)
+        elif step_num == 4:  # Optimized Final README
+            # For step 4, compare original with generated README
+            return self._build_step4_context(base_context, repo_context)
+
+        # Default case: return base context with formatted analysis
+        return base_context.copy()
+
+    def _build_base_context(self, repo_context):
+        """Build the context shared by every step.
+
+        Args:
+            repo_context: Complete repository analysis context
+
+        Returns:
+            Dictionary with the step-independent context
+        """
         # Create the base context
         base_context = {
             "name": repo_context.get("name", "Unknown Project"),
@@ -653,21 +906,6 @@ class ReadmeGenerator:
         if "readme_contents" in repo_context and repo_context["readme_contents"]:
             base_context["existing_readme"] = repo_context["readme_contents"]
 
-        # Step-specific context enrichment
-        if step_num == 1:  # Project Purpose
-            # For step 1, focus on key files and code structure
-            return self._build_step1_context(base_context, repo_context)
-        elif step_num == 2:  # Usage Instructions
-            # For step 2, focus on configuration and execution
-            return self._build_step2_context(base_context, repo_context)
-        elif step_num == 3:  # Final README
-            # For step 3, include all previous outputs and comprehensive information
-            return self._build_step3_context(base_context, repo_context)
-        elif step_num == 4:  # Optimized Final README
-            # For step 4, compare original with generated README
-            return self._build_step4_context(base_context, repo_context)
-
-        # Default case: return base context with formatted analysis
         return base_context
 
 
@@ -692,11 +930,15 @@ class ReadmeGenerator:
         ):
             return True, "README is empty or minimal"
 
-        # Prepare the evaluation prompt
-        evaluation_prompt = """
+        # Prepare the evaluation prompt; the READMEs come first to share a prefix
+        # with the step 4 prompt
+        evaluation_prompt = self._format_readme_comparison(
+            readme_content, generated_readme
+        )
+        evaluation_prompt += """
     # README Evaluation Task
 
-    Your task is to evaluate if an original README is of poor quality and should be replaced with an AI-generated version.
+    Your task is to evaluate if the original README above is of poor quality and should be replaced with the AI-generated version.
 
     ## Examples of Low-Quality READMEs
 
@@ -752,16 +994,6 @@ class ReadmeGenerator:
     7. Consists primarily of generic setup instructions
     8. Lacks actual project description and usage information
 
-    ## Original README to Evaluate:
-    ```
-    {readme_content}
-    ```
-
-    ## AI-Generated Replacement:
-    ```
-    {generated_readme}
-    ```
-
     ## Your Task:
     Based on the examples and common issues, evaluate if the original README should be replaced with the AI-generated version.
 
@@ -777,19 +1009,17 @@ class ReadmeGenerator:
     Then, provide your final answer as either "YES" or "NO" on a separate line.
     """
 
-        evaluation_prompt = evaluation_prompt.format(
-            readme_content=readme_content, generated_readme=generated_readme
-        )
-
         try:
-            # Call the LLM to evaluate the README
-            response = self.llm.invoke(evaluation_prompt)
-            response_text = response.content
+            # Call the LLM to evaluate the README, unless a rerun cached it
+            response_text = self._get_cached_response(evaluation_prompt)
+            if response_text is None:
+                response = await self.llm.ainvoke(evaluation_prompt)
+                response_text = response.content
+                self._cache_response(evaluation_prompt, response_text)
 
             # Extract the answer (YES or NO)
             # Look for YES or NO at the end of the response or on its own line
-            lines = response_text.strip().split("\n")
-            final_line = lines[-1].strip().upper()
+            final_line = response_text.strip().rpartition("\n")[2].strip().upper()
 
             if "YES" in final_line and "NO" not in final_line:
                 return True, response_text
@@ -819,27 +1049,29 @@ class ReadmeGenerator:
         if formatted_analysis:
             step_context["brief_analysis"] = formatted_analysis
 
-        # Prioritize key files - entry points, main classes, and build files
-        key_paths = set()
+        # Prioritize key files - entry points, main classes, and build files. A
+        # list keeps this order stable between runs, unlike a set of strings
+        key_paths = []
 
         # Add entry points only if non-empty
         entry_points = repo_context.get("entry_points", [])
         if entry_points:
-            key_paths.update(entry_points)
+            key_paths.extend(entry_points)
 
         # Add key project files only if non-empty
         key_project_files = repo_context.get("key_project_files", [])
         if key_project_files:
-            key_paths.update(key_project_files)
+            key_paths.extend(key_project_files)
 
         # Add top important files by score
         for file_info in repo_context.get("files", [])[:35]:
             if "path" in file_info:
-                key_paths.add(file_info["path"])
+                key_paths.append(file_info["path"])
 
         # Add file contents for key files, but skip empty files
         key_files_content = {}
-        for path in key_paths:
+        # dict.fromkeys drops repeated paths and keeps the first occurrence
+        for path in dict.fromkeys(key_paths):
             content = repo_context.get("file_contents", {}).get(path, "")
             if content and content.strip():  # Only add non-empty files
                 key_files_content[path] = content
@@ -1016,26 +1248,27 @@ class ReadmeGenerator:
                 [f"- {ep}" for ep in entry_points]
             )
 
-        # Get key paths and filter for non-empty content
-        key_paths = set()
+        # Get key paths and filter for non-empty content, in a stable order
+        key_paths = []
 
         # Add entry points only if non-empty
         if entry_points:
-            key_paths.update(entry_points)
+            key_paths.extend(entry_points)
 
         # Add key project files only if non-empty
         key_project_files = repo_context.get("key_project_files", [])
         if key_project_files:
-            key_paths.update(key_project_files)
+            key_paths.extend(key_project_files)
 
         # Add top files
         for file_info in repo_context.get("files", [])[:10]:  # Limit to top 10
             if "path" in file_info:
-                key_paths.add(file_info["path"])
+                key_paths.append(file_info["path"])
 
         # Add file contents for key files, but skip empty files
         key_files_content = {}
-        for path in key_paths:
+        # dict.fromkeys drops repeated paths and keeps the first occurrence
+        for path in dict.fromkeys(key_paths):
             content = repo_context.get("file_contents", {}).get(path, "")
             if content and content.strip():  # Only add non-empty files
                 key_files_content[path] = content
@@ -1051,13 +1284,10 @@ class ReadmeGenerator:
         step_context = base_context.copy()
 
         # Get the AI-generated README from step 3
-        step3_output = self.get_output_path(3)
-        generated_readme = ""
-        if step3_output.exists() and step3_output.stat().st_size > 0:
-            generated_readme = step3_output.read_text()
+        generated_readme = self._read_step_output(3)
 
         # Clean up any markdown code fences in the generated README
-        if generated_readme.startswith("```") and "```" in generated_readme[3:]:
+        if generated_readme.startswith("```") and generated_readme.find("```", 3) != -1:
             # If it starts with markdown code fences, extract the content between them
             if generated_readme.startswith("```markdown"):
                 start_pos = generated_readme.find("\n", 10) + 1
@@ -1109,8 +1339,6 @@ class ReadmeGenerator:
         step_context["original_readme"] = original_readme
 
         # Use a synchronous wrapper for the async evaluation method
-        import asyncio
-
         try:
             is_crappy, evaluation = asyncio.run(
                 self._is_crappy_readme(original_readme, generated_readme)
@@ -1140,6 +1368,21 @@ class ReadmeGenerator:
 
         return step_context
 
+    def _format_readme_comparison(self, original_readme, generated_readme):
+        """Format the original and generated READMEs as a prompt prefix.
+
+        Args:
+            original_readme: Content of the repository's original README
+            generated_readme: README generated in step 3
+
+        Returns:
+            README_COMPARISON_PROMPT with both READMEs filled in
+        """
+        # Substitute in one pass so placeholder-like text inside a README is kept
+        return Template(self.README_COMPARISON_PROMPT).substitute(
+            original_readme=original_readme, generated_readme=generated_readme
+        )
+
     def _gather_previous_steps_output(self, current_step):
         """
         Gather outputs from previous steps.
@@ -1152,44 +1395,11 @@ class ReadmeGenerator:
         """
         outputs = {}
         for i in range(1, current_step):
-            output_file = self.get_output_path(i)
-            if output_file.exists() and output_file.stat().st_size > 0:
-                outputs[i] = output_file.read_text()
+            output = self._read_step_output(i)
+            if output:
+                outputs[i] = output
         return outputs
 
-    def create_readme_step_chain(self, step_num, context):
-        """
-        Create a LangChain for a specific README generation step using integrated prompts.
-
-        Args:
-            step_num: Step number to process
-            context: Enhanced context for this step
-
-        Returns:
-            Configured LangChain ready to execute
-        """
-        # Get the prompt template for this step from our integrated prompts
-        if step_num not in self.STEP_PROMPTS:
-            self.logger.error(f"No prompt found for step {step_num}")
-            return None
-
-        # Format context manually to avoid template issues with curly braces
-        # Pass the step number to the format method
-        formatted_context = self._format_context_for_prompt(context, step_num)
-
-        # Create PromptTemplate with no input variables since we've pre-filled everything
-        prompt = PromptTemplate(template=formatted_context, input_variables=[])
-
-        # Create the chain with the LLM and prompt
-        chain = LLMChain(
-            llm=self.llm,
-            prompt=prompt,
-            verbose=self.config.log_level == "DEBUG",
-            memory=SimpleMemory(memories={"context": context}),
-        )
-
-        return chain
-
     def _format_context_for_prompt(self, context, step_num=None):
         """
         Format context dictionary into a readable string for prompt inclusion.
@@ -1204,36 +1414,9 @@ class ReadmeGenerator:
             self.logger.error(f"Invalid step number: {step_num}")
             return "Error: Invalid step number"
 
-        template = self.STEP_PROMPTS[step_num]
+        template = Template(self.STEP_PROMPTS[step_num])
 
         if step_num == 4:
-            template = self.STEP_PROMPTS[step_num]
-
-            # Basic repo information
-            template = template.replace("${name}", context.get("name", "Unknown"))
-            template = template.replace(
-                "${language}", context.get("language", "Unknown")
-            )
-
-            # Framework information
-            if context.get("is_spring_boot", False):
-                template = template.replace(
-                    "${is_spring_boot}", "This is a Spring Boot application."
-                )
-            else:
-                template = template.replace("${is_spring_boot}", "")
-
-            # Build system
-            template = template.replace(
-                "${build_system}", context.get("build_system", "unknown")
-            )
-
-            # README assessment
-            template = template.replace(
-                "${readme_recommendation}",
-                context.get("readme_recommendation", "OVERWRITE"),
-            )
-
             # Include the LLM's evaluation text
             evaluation = context.get(
                 "readme_evaluation", "No detailed evaluation available."
@@ -1241,168 +1424,154 @@ class ReadmeGenerator:
             # Limit the evaluation to a reasonable length
             if len(evaluation) > 1000:
                 evaluation = evaluation[:997] + "..."
-            template = template.replace("${readme_evaluation}", evaluation)
 
-            # IMPORTANT: Replace README content placeholders
-            template = template.replace(
-                "${original_readme}",
-                context.get("original_readme", "No original README found."),
+            prompt = template.safe_substitute(
+                # Basic repo information
+                name=context.get("name", "Unknown"),
+                language=context.get("language", "Unknown"),
+                # Framework information
+                is_spring_boot=(
+                    "This is a Spring Boot application."
+                    if context.get("is_spring_boot", False)
+                    else ""
+                ),
+                # Build system
+                build_system=context.get("build_system", "unknown"),
+                # README assessment
+                readme_recommendation=context.get("readme_recommendation", "OVERWRITE"),
+                readme_evaluation=evaluation,
             )
-            template = template.replace(
-                "${generated_readme}",
+
+            # Clean up any potential duplicate newlines
+            prompt = self.BLANK_LINES_PATTERN.sub("\n\n", prompt)
+
+            # IMPORTANT: Lead with the README contents, exactly as the evaluation
+            # prompt does, so both requests share a cacheable prefix
+            readme_comparison = self._format_readme_comparison(
+                context.get("original_readme", "No original README found."),
                 context.get("generated_readme", "No generated README available."),
             )
 
-            # Clean up any potential duplicate newlines
-            template = re.sub(r"\n{3,}", "\n\n", template)
+            return readme_comparison + prompt
 
-            return template
+        # Placeholder values, substituted into the template in a single pass
+        values = {}
 
         # Basic repo information
-        template = template.replace("${name}", context.get("name", "Unknown"))
-        template = template.replace(
-            "${language}", context.get("primary_language", "Unknown")
-        )
+        values["name"] = context.get("name", "Unknown")
+        values["language"] = context.get("primary_language", "Unknown")
 
         # Framework information
         if context.get("is_spring_boot", False):
-            template = template.replace(
-                "${is_spring_boot}", "This is a Spring Boot application."
-            )
+            values["is_spring_boot"] = "This is a Spring Boot application."
         else:
-            template = template.replace("${is_spring_boot}", "")
+            values["is_spring_boot"] = ""
 
         # Build system info
-        template = template.replace(
-            "${build_system}", f"Build System: {context.get('build_system', 'unknown')}"
+        values["build_system"] = (
+            f"Build System: {context.get('build_system', 'unknown')}"
         )
 
         # Analysis information - check for empty content
-        formatted_analysis = context.get("formatted_analysis", "").strip()
-        template = template.replace("${formatted_analysis}", formatted_analysis)
+        values["formatted_analysis"] = context.get("formatted_analysis", "").strip()
 
         # Entry points - CRITICAL for understanding how to run the application
         entry_points = context.get("entry_points", [])
         if entry_points:
             entry_points_str = "\n".join([f"- {ep}" for ep in entry_points])
-            template = template.replace(
-                "${entry_points}", f"## Entry Points\n{entry_points_str}"
-            )
+            values["entry_points"] = f"## Entry Points\n{entry_points_str}"
         else:
-            template = template.replace("${entry_points}", "")
+            values["entry_points"] = ""
 
         # Key components/files
         key_components = context.get("key_project_files", [])
         if key_components:
             key_components_str = "\n".join([f"- {kc}" for kc in key_components])
-            template = template.replace(
-                "${key_components}", f"## Key Components\n{key_components_str}"
-            )
+            values["key_components"] = f"## Key Components\n{key_components_str}"
         else:
-            template = template.replace("${key_components}", "")
+            values["key_components"] = ""
 
-        # Key files content - skip if empty
-        key_files_content = ""
+        # Key files content - files with empty content are skipped; sections are
+        # collected in a list and joined once
+        key_files_sections = []
         key_files = context.get("key_files_content", {})
 
-        # First check if there's any non-empty content at all
-        has_key_files_content = False
-        for content in key_files.values():
-            if content and content.strip():
-                has_key_files_content = True
-                break
-
-        if has_key_files_content:
-            # For Step 2, prioritize important files first
-            if step_num == 2:
-                # Process critical files first to ensure they appear at the top
-                critical_files = [
-                    "build.gradle",
-
-                ]
-
-                # First process critical files
-                for critical_path in critical_files:
-                    if critical_path in key_files:
-                        content = key_files[critical_path]
-                        if content and content.strip():
-                            key_files_content += (
-                                f"### {critical_path}\n```\n{content}\n```\n\n"
-                            )
-
-                # Then process entry point files
-                for path in entry_points:
-                    if path in key_files and path not in critical_files:
-                        content = key_files[path]
-                        if content and content.strip():
-                            key_files_content += f"### {path}\n```\n{content}\n```\n\n"
-
-                # Then process remaining files
-                for path, content in key_files.items():
-                    if path not in critical_files and path not in entry_points:
-                        if content and content.strip():
-                            key_files_content += f"### {path}\n```\n{content}\n```\n\n"
-            else:
-                for path, content in key_files.items():
-                    if not content or content.strip() == "":
-                        continue
+        # For Step 2, prioritize important files first
+        if step_num == 2:
+            # Process critical files first to ensure they appear at the top
+            critical_files = [
+                "build.gradle",
+            ]
+
+            # First process critical files
+            for critical_path in critical_files:
+                if critical_path in key_files:
+                    content = key_files[critical_path]
+                    if content and content.strip():
+                        key_files_sections.append(
+                            f"### {critical_path}\n```\n{content}\n```\n\n"
+                        )
+
+            # Then process entry point files
+            for path in entry_points:
+                if path in key_files and path not in critical_files:
+                    content = key_files[path]
+                    if content and content.strip():
+                        key_files_sections.append(
+                            f"### {path}\n```\n{content}\n```\n\n"
+                        )
+
+            # Then process remaining files
+            for path, content in key_files.items():
+                if path not in critical_files and path not in entry_points:
+                    if content and content.strip():
+                        key_files_sections.append(
+                            f"### {path}\n```\n{content}\n```\n\n"
+                        )
+        else:
+            for path, content in key_files.items():
+                if not content or content.strip() == "":
+                    continue
 
-                    key_files_content += f"### {path}\n```\n{content}\n```\n\n"
+                key_files_sections.append(f"### {path}\n```\n{content}\n```\n\n")
 
-        template = template.replace("${key_files_content}", key_files_content)
+        values["key_files_content"] = "".join(key_files_sections)
 
-        # Configuration files - skip if empty
-        config_files_content = ""
+        # Configuration files - files with empty content are skipped
+        config_files_sections = []
         config_files = context.get("config_files", [])
 
-        # First check if there's any non-empty content
-        has_config_content = False
         for config in config_files:
             if isinstance(config, dict):
+                path = config.get("path", "unknown")
                 content = config.get("content", "")
             else:
-                content = context.get("file_contents", {}).get(config, "")
-
-            if content and content.strip():
-                has_config_content = True
-                break
+                path = config
+                content = context.get("file_contents", {}).get(path, "")
 
-        if has_config_content:
-            for config in config_files:
-                if isinstance(config, dict):
-                    path = config.get("path", "unknown")
-                    content = config.get("content", "")
-                else:
-                    path = config
-                    content = context.get("file_contents", {}).get(path, "")
-
-                # Skip files with empty content
-                if not content or content.strip() == "":
-                    continue
+            # Skip files with empty content
+            if not content or content.strip() == "":
+                continue
 
-                config_files_content += f"### {path}\n```\n{content}\n```\n\n"
+            config_files_sections.append(f"### {path}\n```\n{content}\n```\n\n")
 
-        template = template.replace("${config_files}", config_files_content)
+        values["config_files"] = "".join(config_files_sections)
 
         # Shell scripts - only include non-empty lists
         shell_scripts = context.get("shell_scripts", [])
         if shell_scripts:
             shell_scripts_str = "\n".join([f"- {s}" for s in shell_scripts])
-            template = template.replace(
-                "${shell_scripts}", f"## Shell Scripts\n{shell_scripts_str}"
-            )
+            values["shell_scripts"] = f"## Shell Scripts\n{shell_scripts_str}"
         else:
-            template = template.replace("${shell_scripts}", "")
+            values["shell_scripts"] = ""
 
         # Root shell scripts - only include non-empty lists
         root_scripts = context.get("root_shell_scripts", [])
         if root_scripts:
             root_scripts_str = "\n".join([f"- {s}" for s in root_scripts])
-            template = template.replace(
-                "${root_shell_scripts}", f"## Root Shell Scripts\n{root_scripts_str}"
-            )
+            values["root_shell_scripts"] = f"## Root Shell Scripts\n{root_scripts_str}"
         else:
-            template = template.replace("${root_shell_scripts}", "")
+            values["root_shell_scripts"] = ""
         # Run commands - check for empty objects at each level
         run_commands_content = ""
         has_commands = False
@@ -1426,34 +1595,25 @@ class ReadmeGenerator:
                             run_commands_content += f"- {cmd_type}: `{cmd}`\n"
                     else:
                         run_commands_content += f"- {cmd_type}: `{cmds}`\n"
-        if has_commands:
-            template = template.replace("${run_commands}", run_commands_content)
-        else:
-            template = template.replace("${run_commands}", "")
+        values["run_commands"] = run_commands_content if has_commands else ""
 
         # Include previous step outputs for final README generation
         if "project_purpose" in context and context["project_purpose"].strip():
-            template = template.replace(
-                "${project_purpose}", context["project_purpose"].strip()
-            )
+            values["project_purpose"] = context["project_purpose"].strip()
         else:
-            template = template.replace(
-                "${project_purpose}", "No project purpose identified."
-            )
+            values["project_purpose"] = "No project purpose identified."
 
         if "usage_instructions" in context and context["usage_instructions"].strip():
-            template = template.replace(
-                "${usage_instructions}", context["usage_instructions"].strip()
-            )
+            values["usage_instructions"] = context["usage_instructions"].strip()
         else:
-            template = template.replace(
-                "${usage_instructions}", "No usage instructions available."
-            )
+            values["usage_instructions"] = "No usage instructions available."
+
+        prompt = template.safe_substitute(values)
 
         # Clean up any potential duplicate newlines to keep the prompt clean
-        template = re.sub(r"\n{3,}", "\n\n", template)
+        prompt = self.BLANK_LINES_PATTERN.sub("\n\n", prompt)
 
-        return template
+        return prompt
 
     def _get_step_name(self, step_num):
         """Get the name of a step from its file."""
@@ -1465,16 +1625,16 @@ class ReadmeGenerator:
 
     def get_last_completed_step(self) -> int:
         """Find the last completed step by checking output files."""
-        if not self.config.output_dir.exists():
+        # Only stat entries whose name matches; the size comes from the DirEntry
+        last_step = 0
+        try:
+            with os.scandir(self.config.output_dir) as it:
+                for entry in it:
+                    match = self.STEP_OUTPUT_PATTERN.match(entry.name)
+                    if match and entry.stat().st_size > 0:
+                        last_step = max(last_step, int(match.group(1)))
+        except FileNotFoundError:
             return 0
 
-        pattern = re.compile(r"step_(\d+)_output\.md$")
-        completed_steps = [
-            int(m.group(1))
-            for f in self.config.output_dir.iterdir()
-            if (m := pattern.match(f.name)) and f.stat().st_size > 0
-        ]
-
-        last_step = max(completed_steps, default=0)
         self.logger.info(f"Last completed step: {last_step}")
         return last_step
@@ -5,6 +5,42 @@ import re
 from pathlib import Path
 from typing import List, Dict, Any, Set, Optional, Tuple
 
+# Directory names skipped when searching a repository: VCS metadata,
+# dependency and virtualenv trees, caches and build output
+DEFAULT_EXCLUDE_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "venv",
+        ".venv",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".tox",
+        "target",
+        "build",
+        "dist",
+        ".gradle",
+        "lemma",  # Temporarily ignore 'lemma' directory - will be needed in future
+    }
+)
+
+
+def decode_text(data: bytes, encoding: str = "utf-8") -> str:
+    """Decode file bytes the way a text-mode read would.
+
+    Undecodable bytes are dropped and line endings are normalized to newlines.
+
+    Args:
+        data: Raw file content
+        encoding: File encoding
+
+    Returns:
+        Decoded text
+    """
+    text = data.decode(encoding, errors="ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
 
 def read_file_content(
     file_path: Path, max_size: int = 102400, encoding: str = "utf-8"
@@ -27,13 +63,41 @@ def read_file_content(
         if file_stat.st_size > max_size:
             return None
 
-        with open(file_path, "r", encoding=encoding, errors="ignore") as f:
-            return f.read()
+        with open(file_path, "rb") as f:
+            return decode_text(f.read(), encoding)
     except Exception as e:
         print(f"Error reading file {file_path}: {str(e)}")
         return None
 
 
+def write_text_if_changed(
+    file_path: Path, content: str, encoding: str = "utf-8"
+) -> bool:
+    """Write text to a file unless the file already holds exactly that text.
+
+    Args:
+        file_path: Path to the file
+        content: Text to write
+        encoding: File encoding
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    data = content.encode(encoding)
+    try:
+        # A size mismatch settles it without reading the old content
+        if os.stat(file_path).st_size == len(data):
+            with open(file_path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+
+    with open(file_path, "wb") as f:
+        f.write(data)
+    return True
+
+
 def find_files_by_extensions(
     directory: Path, extensions: Set[str], exclude_dirs: Set[str] = None
 ) -> List[Path]:
@@ -48,17 +112,10 @@ def find_files_by_extensions(
         List of paths to matching files
     """
     if exclude_dirs is None:
-        exclude_dirs = {
-            ".git",
-            "node_modules",
-            "venv",
-            "__pycache__",
-            "target",
-            "build",
-            "dist",
-            ".gradle",
-            "lemma",  # Temporarily ignore 'lemma' directory - will be needed in future
-        }
+        exclude_dirs = DEFAULT_EXCLUDE_DIRS
+
+    # str.endswith accepts a tuple and tests every suffix in one call
+    suffixes = tuple(extensions)
 
     result = []
     for root, dirs, files in os.walk(directory):
@@ -66,9 +123,8 @@ def find_files_by_extensions(
         dirs[:] = [d for d in dirs if d not in exclude_dirs]
 
         for file in files:
-            file_path = Path(os.path.join(root, file))
-            if any(file_path.name.endswith(ext) for ext in extensions):
-                result.append(file_path)
+            if file.endswith(suffixes):
+                result.append(Path(os.path.join(root, file)))
 
     return result
 
@@ -87,17 +143,7 @@ def find_files_by_pattern(
         List of paths to matching files
     """
     if exclude_dirs is None:
-        exclude_dirs = {
-            ".git",
-            "node_modules",
-            "venv",
-            "__pycache__",
-            "target",
-            "build",
-            "dist",
-            ".gradle",
-            "lemma",  # Temporarily ignore 'lemma' directory - will be needed in future
-        }
+        exclude_dirs = DEFAULT_EXCLUDE_DIRS
 
     result = []
     for root, dirs, files in os.walk(directory):
@@ -140,8 +186,8 @@ def get_file_info(
 
         # Add content if file size is under the limit
         if file_stat.st_size <= max_size:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                file_info["content"] = f.read()
+            with open(file_path, "rb") as f:
+                file_info["content"] = decode_text(f.read())
 
         return file_info
 
@@ -210,7 +256,7 @@ def is_config_file(file_path: Path) -> bool:
         Boolean indicating if the file is a configuration file
     """
     # Common config file extensions
-    config_extensions = {".yml", ".yaml", ".properties"}
+    config_extensions = (".yml", ".yaml", ".properties")
 
     # Common config file patterns
     config_patterns = {"config", "settings", "properties", "application"}
@@ -218,7 +264,7 @@ def is_config_file(file_path: Path) -> bool:
     path_str = str(file_path).lower()
 
     # Check by extension
-    if any(path_str.endswith(ext) for ext in config_extensions):
+    if path_str.endswith(config_extensions):
         return True
 
     # Check by name patterns
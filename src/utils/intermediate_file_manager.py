@@ -2,9 +2,13 @@
 
 import json
 import logging
+import shutil
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 
+from src.utils.file_utils import write_text_if_changed
+
 logger = logging.getLogger("debug_utils")
 
 
@@ -154,8 +158,7 @@ class IntermediateFileManager:
             output_path = self.intermediates_dir / output_filename
 
             # Write to file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(output)
+            write_text_if_changed(output_path, output)
 
             logger.info(f"Step output saved to: {output_path}")
             return output_path
@@ -228,8 +231,7 @@ class IntermediateFileManager:
             readme_filename = f"README.md"
             readme_path = self.config.target_repo / readme_filename
 
-            with open(readme_path, "w", encoding="utf-8") as f:
-                f.write(readme_with_watermark)
+            write_text_if_changed(readme_path, readme_with_watermark)
 
             logger.info(f"Final README saved to: {readme_path}")
 
@@ -237,8 +239,7 @@ class IntermediateFileManager:
                 intermediates_readme_path = (
                     self.intermediates_dir / f"{repo_name}_ai.README.md"
                 )
-                with open(intermediates_readme_path, "w", encoding="utf-8") as f:
-                    f.write(readme_with_watermark)
+                write_text_if_changed(intermediates_readme_path, readme_with_watermark)
                 logger.info(
                     f"Copy of final README saved to: {intermediates_readme_path}"
                 )
@@ -248,15 +249,19 @@ class IntermediateFileManager:
                     intermediates_reasoning_path = (
                         self.intermediates_dir / f"{repo_name}_reasoning.md"
                     )
-                    reasoning_content = reasoning_path.read_text(encoding="utf-8")
-                    with open(intermediates_reasoning_path, "w", encoding="utf-8") as f:
-                        f.write(reasoning_content)
-                    logger.info(f"Reasoning saved to: {intermediates_reasoning_path}")
-
-                    # Delete the reasoning.md file if keep_steps is not set
-                    if not self.config.keep_steps:
-                        reasoning_path.unlink()
-                        logger.info(f"Deleted reasoning file: {reasoning_path}")
+                    # The file is moved or copied as raw bytes, never decoded
+                    if self.config.keep_steps:
+                        shutil.copyfile(reasoning_path, intermediates_reasoning_path)
+                        logger.info(
+                            f"Reasoning saved to: {intermediates_reasoning_path}"
+                        )
+                    else:
+                        # reasoning.md is not kept, so move it instead of copying
+                        reasoning_path.replace(intermediates_reasoning_path)
+                        logger.info(
+                            f"Reasoning moved from {reasoning_path} to: "
+                            f"{intermediates_reasoning_path}"
+                        )
 
             return readme_path
 
@@ -275,8 +280,6 @@ def add_watermark(readme_content, model_identifier):
     Returns:
         README content with watermark appended
     """
-    from datetime import datetime
-
     timestamp = datetime.now().strftime("%Y-%m-%d")
 
     # Format a professional, discreet watermark
@@ -0,0 +1,78 @@
+"""On-disk cache of LLM responses keyed by model and prompt."""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("llm_cache")
+
+
+class LLMResponseCache:
+    """Stores LLM responses on disk so identical prompts are not sent twice."""
+
+    def __init__(self, cache_dir: Path, model: str):
+        """Initialize the response cache.
+
+        Args:
+            cache_dir: Directory holding one file per cached response
+            model: Model identifier, part of every cache key
+        """
+        self.cache_dir = cache_dir
+        self.model = model
+        self.cache_dir.mkdir(exist_ok=True, parents=True)
+
+    def _path_for(self, prompt: str) -> Path:
+        """Get the cache file path for a prompt.
+
+        Args:
+            prompt: Prompt sent to the LLM
+
+        Returns:
+            Path of the file holding the cached response
+        """
+        key = hashlib.sha256(f"{self.model}\0{prompt}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.md"
+
+    def get(self, prompt: str) -> Optional[str]:
+        """Get the cached response for a prompt.
+
+        Args:
+            prompt: Prompt sent to the LLM
+
+        Returns:
+            Cached response text, or None on a cache miss
+        """
+        path = self._path_for(prompt)
+        try:
+            # newline="" on both sides keeps line endings exactly as stored
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                response = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Error reading cached response {path}: {str(e)}")
+            return None
+
+        logger.debug(f"LLM response cache hit: {path.name}")
+        return response
+
+    def set(self, prompt: str, response: str) -> None:
+        """Store the response for a prompt.
+
+        The response is written to a temporary file and renamed into place, so
+        an interrupted run never leaves a truncated entry behind.
+
+        Args:
+            prompt: Prompt sent to the LLM
+            response: Response text returned by the LLM
+        """
+        path = self._path_for(prompt)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                f.write(response)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Error caching response {path}: {str(e)}")
@@ -1,5 +1,6 @@
 """Utility functions for ranking files by importance."""
 
+import re
 from pathlib import Path
 from typing import Dict, Any, List, Callable
 
@@ -59,8 +60,6 @@ def rank_by_content_patterns(
     Returns:
         Integer score based on content patterns
     """
-    import re
-
     score = 0
     path = file_info.get("path", "").lower()
     content = file_info.get("content", "")
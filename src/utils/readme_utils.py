@@ -2,6 +2,12 @@
 
 import re
 
+# HTML comments, capturing the comment text without surrounding whitespace
+HTML_COMMENT_PATTERN = re.compile(r"<!--\s*(.*?)\s*-->", re.DOTALL)
+
+# Runs of three or more newlines
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
 
 def extract_reasoning(content):
     """Extract HTML comments (reasoning) from the README content.
@@ -12,18 +18,17 @@ def extract_reasoning(content):
     Returns:
         tuple: (readme_without_reasoning, reasoning_text)
     """
-    # Pattern to match HTML comments
-    pattern = r"<!--\s*(.*?)\s*-->"
-
-    matches = re.findall(pattern, content, re.DOTALL)
+    # A single split yields the text between comments at even indices and the
+    # captured comment text at odd indices
+    parts = HTML_COMMENT_PATTERN.split(content)
 
-    if not matches:
+    if len(parts) == 1:
         return content, ""
 
-    reasoning_text = "\n\n".join(matches)
+    reasoning_text = "\n\n".join(parts[1::2])
 
-    readme_without_reasoning = re.sub(pattern, "", content, flags=re.DOTALL)
+    readme_without_reasoning = "".join(parts[0::2])
 
-    readme_without_reasoning = re.sub(r"\n{3,}", "\n\n", readme_without_reasoning)
+    readme_without_reasoning = BLANK_LINES_PATTERN.sub("\n\n", readme_without_reasoning)
 
     return readme_without_reasoning.strip(), reasoning_text.strip()
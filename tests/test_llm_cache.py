@@ -0,0 +1,128 @@
+"""Tests for the on-disk LLM response cache."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from src.analyzers.java_analizer import JavaAnalyzer
+from src.config import GeneratorConfig
+from src.readme_generator import ReadmeGenerator
+from src.utils.llm_cache import LLMResponseCache
+
+# Repository root, used as the working directory of child processes
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Builds the step prompts for a repository and prints their cache file names
+PROMPT_KEYS_SCRIPT = textwrap.dedent("""
+    import sys
+
+    from src.analyzers.java_analizer import JavaAnalyzer
+    from src.config import GeneratorConfig
+    from src.readme_generator import ReadmeGenerator
+
+    config = GeneratorConfig(
+        target_repo=sys.argv[1], log_level="WARNING", llm_cache=True
+    )
+    generator = ReadmeGenerator(config, JavaAnalyzer(config))
+    generator.repo_context = generator.analyzer.analyze_repository()
+    for step_num in (1, 3):
+        prompt = generator._build_step_prompt(step_num)
+        print(step_num, generator.response_cache._path_for(prompt).name)
+    """)
+
+
+class LLMResponseCacheTest(unittest.TestCase):
+    """Cache hits, misses and exact round trips."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = LLMResponseCache(Path(self.tmp_dir.name), "test-model")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(self.cache.get("never stored"))
+
+    def test_hit_returns_stored_response(self):
+        self.cache.set("prompt", "response")
+        self.assertEqual(self.cache.get("prompt"), "response")
+        self.assertIsNone(self.cache.get("other prompt"))
+
+    def test_key_includes_model(self):
+        self.cache.set("prompt", "response")
+        other_model = LLMResponseCache(Path(self.tmp_dir.name), "other-model")
+        self.assertIsNone(other_model.get("prompt"))
+
+    def test_line_endings_round_trip_exactly(self):
+        response = "a\r\nb\rc\n"
+        self.cache.set("prompt", response)
+        self.assertEqual(self.cache.get("prompt"), response)
+
+
+class PromptCacheKeyTest(unittest.TestCase):
+    """Identical repository input must give identical cache keys."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        repo = Path(self.tmp_dir.name) / "demo"
+        files = {
+            "build.gradle": "plugins { id 'application' }\n",
+            "settings.gradle": "rootProject.name = 'demo'\n",
+            "start.sh": "#!/bin/sh\n./gradlew run\n",
+            "src/main/resources/application.yml": "server:\n  port: 8080\n",
+            "src/main/java/demo/App.java": (
+                "@SpringBootApplication\npublic class App {\n"
+                "    public static void main(String[] args) {}\n}\n"
+            ),
+        }
+        for i in range(8):
+            files[f"src/main/java/demo/Service{i}.java"] = (
+                f"@Service\npublic class Service{i} {{}}\n"
+            )
+        for rel_path, content in files.items():
+            path = repo / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        self.repo = repo
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _prompt_keys(self, hash_seed: str) -> str:
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        result = subprocess.run(
+            [sys.executable, "-c", PROMPT_KEYS_SCRIPT, str(self.repo)],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout
+
+    def test_keys_match_across_processes(self):
+        keys = self._prompt_keys("1")
+        self.assertEqual(len(keys.splitlines()), 2)
+        for hash_seed in ("2", "3", "4"):
+            self.assertEqual(self._prompt_keys(hash_seed), keys)
+
+    def test_cache_follows_config(self):
+        config = GeneratorConfig(target_repo=str(self.repo))
+        generator = ReadmeGenerator(config, JavaAnalyzer(config))
+        self.assertIsNone(generator.response_cache)
+
+        cached_config = GeneratorConfig(target_repo=str(self.repo), llm_cache=True)
+        generator = ReadmeGenerator(cached_config, JavaAnalyzer(cached_config))
+        self.assertIsInstance(generator.response_cache, LLMResponseCache)
+        self.assertEqual(
+            generator.response_cache.cache_dir, cached_config.llm_cache_dir
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()